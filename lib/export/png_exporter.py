@@ -16,6 +16,8 @@ except:
     from os.path import dirname
     sys.path.append(dirname(dirname(dirname(__file__))))
 
+import collections
+import concurrent.futures
 import time
 from pathlib import Path
 from typing import List, Generator
@@ -39,6 +41,16 @@ from lib.export.exporters import (
 )
 
 
+def _save_png(image: PIL.Image.Image, path: Path, dpi: int) -> None:
+    """Save `image` as a PNG with DPI metadata through a 1 MiB write buffer.
+
+    The encoder issues several small writes per IDAT chunk; the larger
+    buffer batches them into a few big ones.
+    """
+    with open(path, 'wb', buffering=1 << 20) as fp:
+        image.save(fp, format='PNG', dpi=(dpi, dpi))
+
+
 class PngWallCalendarExporterBase(BaseExporter):
     _WAL_CAL = None  # To be defined in subclasses
     """Export wall calendars to PNG image files.
@@ -137,7 +149,7 @@ class PngWallCalendarExporterBase(BaseExporter):
                 output_path = context.output_dir / f"Page_{output_index}.png"
                 
                 # Save with DPI metadata
-                img.save(str(output_path), dpi=(dpi, dpi))
+                _save_png(img, output_path, dpi)
                 result.files.append(output_path)
                 
                 page_index += 1
@@ -184,6 +196,8 @@ class PngDeskCalendarExporterBase(BaseExporter):
             'description': 'Dots per inch for rendering the PNG images',
         },
     }
+    # Pages being encoded to PNG while the next page renders
+    SAVES_AHEAD = 2
 
     def get_output_subdir_name(self) -> str:
         """Return the subdirectory name where pages are saved."""
@@ -230,23 +244,33 @@ class PngDeskCalendarExporterBase(BaseExporter):
             estimated_total = 13
             total_pages = 0
 
-            for i, img in enumerate(imgs_generator):
-                context.report_progress(i + 1, estimated_total, f"Saving page {i}")
-
-                if img is None:
-                    result.add_error(f"Page {i} returned None from renderer")
-                    continue
-
-                # Get PIL.Image from wrapper if needed
-                pil_img = img.image if hasattr(img, 'image') else img
-
-                # Transform (e.g., expand to legal) and save with DPI metadata
-                final_img = self.transform_image(pil_img)
-                out_path = out_dir / f"Page_{i}.png"
-                final_img.save(str(out_path), dpi=(dpi, dpi))
-                result.files.append(out_path)
-
-                total_pages = i + 1
+            # PNG encoding releases the GIL, so finished pages are saved on
+            # worker threads while the next page renders. At most
+            # SAVES_AHEAD saves are queued, which bounds how many pages
+            # wait in memory.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.SAVES_AHEAD) as ex:
+                saves = collections.deque()
+                for i, img in enumerate(imgs_generator):
+                    context.report_progress(i + 1, estimated_total, f"Saving page {i}")
+
+                    if img is None:
+                        result.add_error(f"Page {i} returned None from renderer")
+                        continue
+
+                    # Get PIL.Image from wrapper if needed
+                    pil_img = img.image if hasattr(img, 'image') else img
+
+                    # Transform (e.g., expand to legal) and save with DPI metadata
+                    final_img = self.transform_image(pil_img)
+                    out_path = out_dir / f"Page_{i}.png"
+                    if len(saves) >= self.SAVES_AHEAD:
+                        saves.popleft().result()
+                    saves.append(ex.submit(_save_png, final_img, out_path, dpi))
+                    result.files.append(out_path)
+
+                    total_pages = i + 1
+                while saves:
+                    saves.popleft().result()
 
             # Add metadata
             result.metadata['dpi'] = dpi
@@ -409,7 +433,7 @@ class PngPhotoExporter(BaseExporter):
                     stem = f"Photo_{i}"
 
                 out_path = out_dir / f"{stem}.png"
-                pil_img.save(str(out_path), dpi=(dpi, dpi))
+                _save_png(pil_img, out_path, dpi)
                 result.files.append(out_path)
 
             # Metadata
@@ -5,7 +5,9 @@ paths for images, CSS and other assets used by the application.
 """
 
 from io import TextIOWrapper
+from typing import Tuple
 
+import hashlib
 import pathlib
 import shutil
 import os
@@ -25,11 +27,12 @@ class FilesManager:
         CSS (set): allowed css suffixes.
         CSS_PATH (str): directory name where css files are stored.
     """
-    IMAGES = set([".png", ".jpg", ".jpeg", ".bmp"])
+    IMAGES = set([".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tif", ".tiff", ".webp"])
     IMAGES_PATH = "images"
     DOCS = set([])
     CSS = set(['.css'])
     CSS_PATH = "css"
+    THUMBS_PATH = ".thumbs"
 
     _instance: 'FilesManager' = None
 
@@ -186,6 +189,21 @@ class FilesManager:
         parent = str(self._path)
         return path.startswith(parent)
 
+    def get_thumbnail_path(self, filename: str, size: Tuple[int, int]) -> pathlib.Path:
+        """Return where the ``size`` thumbnail of ``filename`` is cached.
+
+        Thumbnails live under the hidden .thumbs folder of the project and
+        are named after a hash of the source path, so renames never collide.
+        The folder is created if necessary; the file itself may not exist.
+        """
+        src = str(pathlib.Path(filename).absolute())
+        digest = hashlib.sha1(src.encode("utf-8")).hexdigest()
+        path = pathlib.Path(self._path, FilesManager.THUMBS_PATH,
+                            f"{digest}_{size[0]}x{size[1]}.png")
+        if not path.parent.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
     def open(self, filename, mode) -> TextIOWrapper:
         """Open a file for reading/writing inside the project.
 
@@ -191,10 +191,11 @@ class BirthdayPanel(wx.Panel):
     def load(self, data: dict) -> None:
         """Load birthdays from a dict produced by to_json."""
         # self._scrolling_panel.clear()
-        for item in data["birthdays"]:
-            panel = BirthdayInfoPanel(parent=self._scrolling_panel, image=None)
-            panel.load(item)
-            self._scrolling_panel.Add(panel)
+        with self._scrolling_panel.bulk_update():
+            for item in data["birthdays"]:
+                panel = BirthdayInfoPanel(parent=self._scrolling_panel, image=None)
+                panel.load(item)
+                self._scrolling_panel.Add(panel)
         # self._scrolling_panel.Refresh()
         self.Layout()
         self.Refresh()
@@ -35,11 +35,24 @@ from lib.gui.exporter import ExporterPanel
 from lib.gui.photo_labels import PhotoLabelsPanel
 from lib.gui.settings import Settings
 
+try:
+    import orjson as _orjson
+except ImportError:
+    # orjson is optional; fall back to the stdlib parser
+    _orjson = None
+
 ######################################################
 # Editor Main
 ######################################################
 
 
+def _load_project(fp) -> dict:
+    """Parse a Project.json file object, using orjson when it is available."""
+    if _orjson is not None:
+        return _orjson.loads(fp.read())
+    return json.load(fp)
+
+
 class CalendarInfoFrame(MainFrame):
     """Main editor frame providing project menu, notebook pages and
     convenience helpers for loading/saving project state and building
@@ -58,12 +71,14 @@ class CalendarInfoFrame(MainFrame):
         path = OpenDialog.ChoseFile(self, "Open Project", OpenDialog.JSON)
         if path:
             with open(path) as fp:
-                obj = json.load(fp)
+                obj = _load_project(fp)
                 obj['project'] = str(pathlib.Path(path).parent)
                 self.load(obj)
 
     def project_save(self, event: wx.Event) -> None:
         """Save the current project to Project.json inside the project root."""
+        # Don't lose a year selection that is still being debounced
+        self._export_view.commit_pending()
         with self._files_manager.open("Project.json", "w+") as file:
             obj = self.to_json()
             file.write(json.dumps(obj, indent="    "))
@@ -156,7 +171,7 @@ class CalendarInfoFrame(MainFrame):
 
         try:
             with self._files_manager.open("Project.json", "r+") as file:
-                obj = json.load(file)
+                obj = _load_project(file)
                 obj["project"] = str(self._files_manager.root)
                 self.load(obj)
         except:
@@ -298,12 +313,15 @@ class CalendarInfoFrame(MainFrame):
             
             if result == wx.ID_YES:
                 self.project_save(None)
+                OpenDialog.destroy_cached()
                 event.Skip()  # Continue with close
             elif result == wx.ID_NO:
+                OpenDialog.destroy_cached()
                 event.Skip()  # Continue with close without saving
             else:  # wx.ID_CANCEL
                 event.Veto()  # Cancel the close
         else:
+            OpenDialog.destroy_cached()
             event.Skip()  # No unsaved changes, close normally
 
 class MyApp(wx.App):
@@ -17,7 +17,7 @@ import wx
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
-from lib.gui.settings import Settings
+from lib.gui.settings import Settings, YearSettings
 from lib.filemanager import FilesManager
 from lib.gui.util import MainFrame
 
@@ -37,9 +37,16 @@ class ExporterPanel(wx.Panel):
     exporter variant. It dynamically generates UI controls based on the selected
     exporter's OPTIONS_SCHEMA.
     """
+    YEAR_DEBOUNCE_MS = 150
+
     def __init__(self, *args, **kargs):
         super().__init__(*args, **kargs)
-        
+        self._year_timer: wx.CallLater = None
+        # Lock updates while the rows are built so the panel lays out once
+        with wx.WindowUpdateLocker(self):
+            self._build_controls()
+
+    def _build_controls(self):
         self._option_controls: Dict[str, wx.Control] = {}
         self._current_exporter_class: Optional[type] = None
         
@@ -52,7 +59,7 @@ class ExporterPanel(wx.Panel):
         self._year_ctrl = wx.ComboBox(
             self,
             value=str(Settings.year),
-            choices=[str(i) for i in range(2000, 2055)],
+            choices=YearSettings.YEARs,
             style=wx.CB_READONLY
         )
         self._year_ctrl.Bind(wx.EVT_COMBOBOX, self.on_year_changed)
@@ -159,9 +166,28 @@ class ExporterPanel(wx.Panel):
         return self._exporter_ctrl.GetValue()
     
     def on_year_changed(self, event: wx.Event):
-        """Handler when year selection changes."""
-        value = self._year_ctrl.GetValue()
-        Settings.set_year(int(value))
+        """Handler when year selection changes.
+
+        Selections are debounced: arrowing through the list restarts the
+        timer, and only the last year reaches Settings once
+        YEAR_DEBOUNCE_MS has elapsed without a further change.
+        """
+        if self._year_timer is not None:
+            self._year_timer.Stop()
+        self._year_timer = wx.CallLater(
+            ExporterPanel.YEAR_DEBOUNCE_MS, self._commit_year, self._year_ctrl.GetValue())
+
+    def _commit_year(self, value: str):
+        self._year_timer = None
+        Settings.set_year(YearSettings.YEAR_VALUES[value])
+
+    def commit_pending(self):
+        """Apply a debounced year selection now instead of waiting for its timer."""
+        timer = self._year_timer
+        if timer is not None and timer.IsRunning():
+            timer.Stop()
+            self._commit_year(self._year_ctrl.GetValue())
+        self._year_timer = None
     
     def on_calendar_type_changed(self, event: wx.Event):
         """Handler when calendar type selection changes."""
@@ -354,6 +380,8 @@ class ExporterPanel(wx.Panel):
         main_frame = self.get_main_frame()
         if not main_frame:
             return
+        # The calendar is built for Settings.year, so apply a pending selection
+        self.commit_pending()
         
         # Get calendar based on type
         data_type = self.get_selected_calendar_type()
@@ -451,6 +479,14 @@ class ExporterPanel(wx.Panel):
 
     def apply_saved_settings(self):
         """Apply saved export settings to controls and options UI."""
+        # A selection still waiting on its timer belongs to the old settings
+        if self._year_timer is not None:
+            self._year_timer.Stop()
+            self._year_timer = None
+        with wx.WindowUpdateLocker(self):
+            self._restore_controls()
+
+    def _restore_controls(self):
         # Year
         self._year_ctrl.SetValue(str(Settings.year))
         # Export selection
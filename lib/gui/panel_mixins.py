@@ -16,7 +16,7 @@ except Exception:
 
 from typing import List, Tuple
 from lib.filemanager import FilesManager
-from lib.gui.util import ScrolledPanel
+from lib.gui.util import ScrolledPanel, prefetch_metadata
 
 
 class ScrolledPanelItemsMixin:
@@ -43,6 +43,15 @@ class ArtworkPanelOpsMixin(ScrolledPanelItemsMixin):
 
     def load(self, data: dict) -> None:
         pages = data["pages"]
+        # Read EXIF for every page up front so the per-page loads hit the cache
+        fm = FilesManager.instance()
+        paths = []
+        for page in pages:
+            if page.get("image"):
+                path = fm.get_file_path(page["image"])
+                if fm.is_managed_file(path):
+                    paths.append(str(path))
+        prefetch_metadata(paths)
         items = self._scrolling_panel.Items()
         for i in range(len(pages)):
             items[i].load(pages[i])
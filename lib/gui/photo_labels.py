@@ -361,10 +361,11 @@ class PhotoLabelsPanel(wx.Panel):
         self.sort()
 
     def load(self, data: dict) -> None:
-        for item in data.get("photos", []):
-            panel = PhotoLabelInfoPanel(parent=self._scrolling_panel)
-            panel.load(item)
-            self._scrolling_panel.Add(panel)
+        with self._scrolling_panel.bulk_update():
+            for item in data.get("photos", []):
+                panel = PhotoLabelInfoPanel(parent=self._scrolling_panel)
+                panel.load(item)
+                self._scrolling_panel.Add(panel)
         self.Layout()
         self.Refresh()
 
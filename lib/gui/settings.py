@@ -15,8 +15,17 @@ import wx
 import wx.adv
 
 import datetime
+from types import MappingProxyType
 
-import lib.gui.util as libutil
+_EMPTY_OPTIONS = MappingProxyType({})
+
+# Default export selection; "options" (per-exporter name -> dict) is added
+# as a fresh dict wherever these defaults are materialized.
+_EXPORT_DEFAULTS = {
+    "calendar_type": "wall",   # 'wall' or 'desk'
+    "format": "png",           # 'png', 'html', 'pdf', etc.
+    "exporter_name": "default",
+}
 
 class Settings(object):
     """Application-wide settings singleton.
@@ -37,13 +46,9 @@ class Settings(object):
     def __init__(self):
         self._settings = {}
         self._settings["year"] = datetime.datetime.now().year
-        # Default export settings structure
-        self._settings["export"] = {
-            "calendar_type": "wall",   # 'wall' or 'desk'
-            "format": "png",          # 'png', 'html', 'pdf', etc.
-            "exporter_name": "default",
-            "options": {}               # per-exporter options map: name -> dict
-        }
+        self._settings["export"] = {**_EXPORT_DEFAULTS, "options": {}}
+        # Direct handle on the export sub-dict; rebound whenever it is replaced
+        self._export = self._settings["export"]
 
     @property
     def year(self) -> int:
@@ -72,39 +77,39 @@ class Settings(object):
         export = self._settings.get("export")
         if not isinstance(export, dict):
             export = {}
-        export.setdefault("calendar_type", "wall")
-        export.setdefault("format", "png")
-        export.setdefault("exporter_name", "default")
-        export.setdefault("options", {})
-        self._settings["export"] = export
+        self._settings["export"] = {**_EXPORT_DEFAULTS, "options": {}, **export}
+        self._export = self._settings["export"]
 
     # ---- Export settings helpers ----
     def get_export_selection(self) -> dict:
         """Return current export selection (calendar_type, format, exporter_name)."""
-        exp = self._settings.get("export", {})
+        exp = self._export
         return {
-            "calendar_type": exp.get("calendar_type", "wall"),
-            "format": exp.get("format", "png"),
-            "exporter_name": exp.get("exporter_name", "default")
+            "calendar_type": exp["calendar_type"],
+            "format": exp["format"],
+            "exporter_name": exp["exporter_name"]
         }
 
     def set_export_selection(self, calendar_type: str, format: str, exporter_name: str):
         """Update current export selection values."""
-        exp = self._settings.setdefault("export", {})
+        exp = self._export
         exp["calendar_type"] = calendar_type
         exp["format"] = format
         exp["exporter_name"] = exporter_name
 
-    def get_export_options(self, exporter_name: str) -> dict:
-        """Return saved option values for the given exporter name."""
-        exp = self._settings.get("export", {})
-        options = exp.get("options", {})
-        return dict(options.get(exporter_name, {}))
+    def get_export_options(self, exporter_name: str) -> MappingProxyType:
+        """Return a read-only view of saved option values for the given exporter name."""
+        options = self._export.get("options") or {}
+        saved = options.get(exporter_name)
+        return _EMPTY_OPTIONS if saved is None else MappingProxyType(saved)
+
+    def get_export_options_mutable(self, exporter_name: str) -> dict:
+        """Return a mutable copy of saved option values for the given exporter name."""
+        return dict(self.get_export_options(exporter_name))
 
     def set_export_options(self, exporter_name: str, opts: dict):
         """Persist option values for the given exporter name."""
-        exp = self._settings.setdefault("export", {})
-        options = exp.setdefault("options", {})
+        options = self._export.setdefault("options", {})
         options[exporter_name] = dict(opts or {})
 
 Settings = Settings()
@@ -127,13 +132,16 @@ class BaseSetting(wx.BoxSizer):
 class YearSettings(BaseSetting):
     """Row widget allowing the user to select the target calendar year."""
     YEARs = [str(i) for i in range(2000, 2055)]
+    # The choice list is closed, so map each label straight to its int
+    YEAR_VALUES = {year: int(year) for year in YEARs}
+
     def __init__(self, parent):
         super().__init__(parent, label="Year", value=str(Settings.year), choices=YearSettings.YEARs)
 
     def update(self, event: wx.Event):
         """Handle user selection and update the Settings singleton."""
         value = self._ctrl.GetValue()
-        Settings.set_year(int(value))
+        Settings.set_year(YearSettings.YEAR_VALUES[value])
 
 class SettingsPanel(wx.Panel):
     """Panel exposing controls to edit application settings.
@@ -8,7 +8,8 @@ throughout the GUI.
 import wx
 import wx.lib.scrolledpanel as scrolled
 
-from typing import List, Tuple, Any, Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Tuple, Any, Optional
 
 try:
     import lib as __lib
@@ -18,44 +19,73 @@ except:
     sys.path.append(dirname(dirname(dirname(__file__))))
 
 from lib.filemanager import FilesManager
-import lib.gui.geoutil as geoutil
 import PIL.Image
 import lib.pycal as libpycal
 import piexif
+import concurrent.futures
+import contextlib
 import datetime
+import functools
+import mmap
+import os
+import re
+import struct
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime: it pulls in googlemaps/requests
+    import lib.gui.geoutil as geoutil
 
 
 def get_image_metadata(image: str) -> dict:
     """Extract basic EXIF metadata (DateTimeOriginal, GPS) from an image file.
 
     Returns a dictionary with any discovered keys. Best-effort: failures
-    return an empty dict instead of raising.
+    return an empty dict instead of raising. Results are cached per file
+    path, modification time and size, so re-selecting an unchanged image
+    does not parse it again.
     """
+    try:
+        st = os.stat(image)
+    except (OSError, TypeError, ValueError):
+        return _read_image_metadata.__wrapped__(image, None, None)
+    return dict(_read_image_metadata(os.path.abspath(image), st.st_mtime_ns, st.st_size))
+
 
+def prefetch_metadata(paths: List[str], max_workers: int = 8) -> dict:
+    """Read metadata for several images concurrently.
+
+    Returns a mapping of path -> metadata dict. Results also land in the
+    get_image_metadata cache, so later per-image calls are lookups.
+    """
+    unique = list(dict.fromkeys(p for p in paths if p))
+    if not unique:
+        return {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as pool:
+        return dict(zip(unique, pool.map(get_image_metadata, unique)))
+
+
+@functools.lru_cache(maxsize=512)
+def _read_image_metadata(image: str, mtime_ns: int, size: int) -> dict:
+    """Parse the EXIF metadata of `image`.
+
+    `mtime_ns` and `size` are not used by the parse itself; they only make
+    the lru_cache key change whenever the file does.
+    """
     result = {}
     try:
-        # Fast path: let piexif parse the file directly when possible (e.g., JPEG)
+        # Fast path: read the Exif/GPS IFDs through a memory map, falling
+        # back to a full piexif parse for anything the small reader rejects
         try:
-            exif_dict = piexif.load(image)
-            exif = exif_dict.get('Exif', {})
-
-            dto = exif.get(piexif.ExifIFD.DateTimeOriginal, None)
-            if isinstance(dto, bytes):
-                try:
-                    dto = dto.decode('utf-8')
-                except Exception:
-                    dto = str(dto)
-            if dto is not None:
-                result["DateTimeOriginal"] = dto
-
-            lat, lon, alt = gps_from_exif(exif_dict)
-            if lat is not None and lon is not None:
-                result["GPSLatitude"] = lat
-                result["GPSLongitude"] = lon
-            if alt is not None:
-                result["GPSAltitude"] = alt
+            try:
+                exif_dict = _read_exif_fast(image)
+            except Exception:
+                exif_dict = None
+            if exif_dict is None:
+                exif_dict = piexif.load(image)
+            _extract_from_exif_dict(exif_dict, result)
             return result
-        except Exception:
+        except piexif.InvalidImageDataError:
+            # Not a JPEG/TIFF container; PIL may still find embedded EXIF
             pass
 
         # Fallback: open with PIL and extract embedded EXIF bytes
@@ -63,25 +93,7 @@ def get_image_metadata(image: str) -> dict:
             exif_bytes = im.info.get("exif")
             if not exif_bytes:
                 return result
-
-            exif_dict = piexif.load(exif_bytes)
-            exif = exif_dict.get('Exif', {})
-
-            dto = exif.get(piexif.ExifIFD.DateTimeOriginal, None)
-            if isinstance(dto, bytes):
-                try:
-                    dto = dto.decode('utf-8')
-                except Exception:
-                    dto = str(dto)
-            if dto is not None:
-                result["DateTimeOriginal"] = dto
-
-            lat, lon, alt = gps_from_exif(exif_dict)
-            if lat is not None and lon is not None:
-                result["GPSLatitude"] = lat
-                result["GPSLongitude"] = lon
-            if alt is not None:
-                result["GPSAltitude"] = alt
+            _extract_from_exif_dict(piexif.load(exif_bytes), result)
     except Exception:
         # Failed to open image or parse EXIF; return whatever we have so far
         pass
@@ -89,6 +101,155 @@ def get_image_metadata(image: str) -> dict:
     return result
 
 
+def _extract_from_exif_dict(exif_dict: dict, result: dict) -> None:
+    """Copy DateTimeOriginal and GPS values from a piexif dict into `result`."""
+    exif = exif_dict.get('Exif', {})
+
+    dto = exif.get(piexif.ExifIFD.DateTimeOriginal, None)
+    if isinstance(dto, bytes):
+        try:
+            dto = dto.decode('utf-8')
+        except Exception:
+            dto = str(dto)
+    if dto is not None:
+        result["DateTimeOriginal"] = dto
+
+    lat, lon, alt = gps_from_exif(exif_dict)
+    if lat is not None and lon is not None:
+        result["GPSLatitude"] = lat
+        result["GPSLongitude"] = lon
+    if alt is not None:
+        result["GPSAltitude"] = alt
+
+
+# Accepted NumberText input (after strip)
+_INT_RE = re.compile(r"[+-]?\d+")
+
+# Placeholder syntax for TextTemplate: {key} or {key:fmt}
+_TEMPLATE_RE = re.compile(r"\{([A-Za-z0-9_.]+)(?::([^}]+))?\}")
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Containers that never carry EXIF (BMP, GIF)
+_NO_EXIF_MAGIC = (b"BM", b"GIF8")
+_EXIF_IFD_POINTER = 0x8769
+_GPS_IFD_POINTER = 0x8825
+# TIFF type id -> (struct format, size in bytes)
+_TIFF_TYPES = {
+    1: ("B", 1),    # BYTE
+    2: ("s", 1),    # ASCII
+    3: ("H", 2),    # SHORT
+    4: ("L", 4),    # LONG
+    5: ("LL", 8),   # RATIONAL
+    7: ("s", 1),    # UNDEFINED
+    9: ("l", 4),    # SLONG
+    10: ("ll", 8),  # SRATIONAL
+}
+
+
+def _read_exif_fast(image: str) -> Optional[dict]:
+    """Read DateTimeOriginal and the GPS IFD through a memory map of `image`.
+
+    For JPEGs and PNGs only the segment/chunk headers and the Exif payload
+    are touched: IFD0 is scanned for the Exif and GPS pointers, then just
+    those two IFDs are decoded. TIFF files are handed to piexif as the mapping
+    itself so they are never read into memory whole. Values use the same
+    shapes as ``piexif.load`` so the result can be fed to `gps_from_exif`.
+    BMP and GIF are answered from their magic bytes alone. Returns None for
+    other containers; raises on malformed headers so callers can fall back
+    to piexif.
+    """
+    with open(image, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic = mm[:2]
+            if magic in (b"II", b"MM"):
+                return piexif.load(mm)
+            if mm[:8] == _PNG_SIGNATURE:
+                return _read_png_exif(mm)
+            if mm[:4].startswith(_NO_EXIF_MAGIC):
+                return {"Exif": {}, "GPS": {}}
+            if magic != b"\xff\xd8":
+                return None
+            pos = 2
+            while pos + 4 <= len(mm):
+                if mm[pos] != 0xFF:
+                    return None
+                marker = mm[pos + 1]
+                if marker in (0xD9, 0xDA):  # EOI / start of scan
+                    break
+                seg_len = struct.unpack_from(">H", mm, pos + 2)[0]
+                if marker == 0xE1 and mm[pos + 4:pos + 10] == b"Exif\x00\x00":
+                    return _decode_exif_tiff(mm[pos + 10:pos + 2 + seg_len])
+                pos += 2 + seg_len
+    return {"Exif": {}, "GPS": {}}
+
+
+def _read_png_exif(mm: mmap.mmap) -> dict:
+    """Find the eXIf chunk of a PNG, stopping at the first IDAT like PIL."""
+    pos = len(_PNG_SIGNATURE)
+    while pos + 8 <= len(mm):
+        length, ctype = struct.unpack_from(">L4s", mm, pos)
+        if ctype in (b"IDAT", b"IEND"):
+            break
+        if ctype == b"eXIf":
+            return _decode_exif_tiff(mm[pos + 8:pos + 8 + length])
+        pos += 12 + length  # length + type + data + crc
+    return {"Exif": {}, "GPS": {}}
+
+
+def _decode_exif_tiff(tiff: bytes) -> dict:
+    try:
+        return _parse_tiff_exif(tiff)
+    except Exception:
+        # Let piexif decode just this payload
+        return piexif.load(b"Exif\x00\x00" + tiff)
+
+
+def _parse_tiff_exif(tiff: bytes) -> dict:
+    endian = {b"II": "<", b"MM": ">"}[tiff[:2]]
+    ifd0 = struct.unpack_from(endian + "L", tiff, 4)[0]
+
+    def read_ifd(offset, wanted=None):
+        entries = {}
+        count = struct.unpack_from(endian + "H", tiff, offset)[0]
+        for i in range(count):
+            entry = offset + 2 + i * 12
+            tag, typ, length = struct.unpack_from(endian + "HHL", tiff, entry)
+            if wanted is not None and tag not in wanted:
+                continue
+            if typ not in _TIFF_TYPES:
+                continue
+            fmt, size = _TIFF_TYPES[typ]
+            value_at = entry + 8
+            if size * length > 4:
+                value_at = struct.unpack_from(endian + "L", tiff, value_at)[0]
+            if fmt == "s":
+                end = value_at + length
+                if value_at < 0 or end > len(tiff):
+                    raise ValueError("Exif value out of range")
+                data = tiff[value_at:end - 1] if typ == 2 else tiff[value_at:end]
+            elif len(fmt) == 2:
+                flat = struct.unpack_from(endian + fmt * length, tiff, value_at)
+                data = tuple(zip(flat[0::2], flat[1::2]))
+            else:
+                data = struct.unpack_from(endian + fmt * length, tiff, value_at)
+            if isinstance(data, tuple) and len(data) == 1:
+                data = data[0]
+            entries[tag] = data
+            if wanted is not None and len(entries) == len(wanted):
+                break
+        return entries
+
+    pointers = read_ifd(ifd0, (_EXIF_IFD_POINTER, _GPS_IFD_POINTER))
+    exif = {}
+    gps = {}
+    if _EXIF_IFD_POINTER in pointers:
+        exif = read_ifd(pointers[_EXIF_IFD_POINTER],
+                        (piexif.ExifIFD.DateTimeOriginal,))
+    if _GPS_IFD_POINTER in pointers:
+        gps = read_ifd(pointers[_GPS_IFD_POINTER])
+    return {"Exif": exif, "GPS": gps}
+
+
 def _rat2float(r):
     try:
         n, d = r
@@ -98,19 +259,45 @@ def _rat2float(r):
 
 
 def _dms_to_deg(dms):
+    try:
+        n0, d0 = dms[0]
+        n1, d1 = dms[1]
+        n2, d2 = dms[2] if len(dms) > 2 else (0, 1)
+        return n0 / d0 + n1 / (d1 * 60.0) + n2 / (d2 * 3600.0)
+    except Exception:
+        # Zero denominators or non-rational entries: go field by field
+        pass
     deg = _rat2float(dms[0])
     minutes = _rat2float(dms[1])
     seconds = _rat2float(dms[2]) if len(dms) > 2 else 0.0
     return deg + minutes / 60.0 + seconds / 3600.0
 
 
+def _int_key(k: Any) -> Any:
+    try:
+        return int(k) if isinstance(k, str) else k
+    except ValueError:
+        return k
+
+
+_SOUTH_REFS = frozenset("Ss")
+_WEST_REFS = frozenset("Ww")
+
+
+def _is_negative_ref(ref: Any, negative: frozenset, letter: str) -> bool:
+    if isinstance(ref, str) and len(ref) == 1:
+        return ref in negative
+    # Unusual spellings such as "South" or padded values
+    return str(ref).upper().startswith(letter)
+
+
 def gps_from_exif(exif_dict) -> Tuple[Optional[float], Optional[float], Optional[float]]:
     gps = exif_dict.get("GPS", {}) or {}
-    # normalize keys to ints
-    norm = {}
-    for k, v in gps.items():
-        ik = int(k) if isinstance(k, str) and k.isdigit() else k
-        norm[ik] = v
+    # normalize keys to ints (piexif already returns int keys)
+    if all(isinstance(k, int) for k in gps):
+        norm = gps
+    else:
+        norm = {_int_key(k): v for k, v in gps.items()}
 
     def decode_ref(x: Any):
         if isinstance(x, bytes):
@@ -128,9 +315,9 @@ def gps_from_exif(exif_dict) -> Tuple[Optional[float], Optional[float], Optional
     if lat_val and lat_ref and lon_val and lon_ref:
         lat = _dms_to_deg(lat_val)
         lon = _dms_to_deg(lon_val)
-        if str(lat_ref).upper().startswith("S"):
+        if _is_negative_ref(lat_ref, _SOUTH_REFS, "S"):
             lat = -abs(lat)
-        if str(lon_ref).upper().startswith("W"):
+        if _is_negative_ref(lon_ref, _WEST_REFS, "W"):
             lon = -abs(lon)
     alt_val = norm.get(piexif.GPSIFD.GPSAltitude) or norm.get(6)
     if alt_val is not None:
@@ -138,45 +325,185 @@ def gps_from_exif(exif_dict) -> Tuple[Optional[float], Optional[float], Optional
     return lat, lon, alt
 
 
+_UNSET = object()
+
+
+def _parse_exif_datetime(dto: Any) -> Optional[datetime.datetime]:
+    """Parse an EXIF 'YYYY:MM:DD HH:MM:SS' value, or return None."""
+    if dto is not None and isinstance(dto, bytes):
+        try:
+            dto = dto.decode('utf-8')
+        except Exception:
+            dto = str(dto)
+    if not dto:
+        return None
+    try:
+        # Slicing is much cheaper than strptime for the canonical layout
+        if (len(dto) == 19 and dto[4] == dto[7] == dto[13] == dto[16] == ':'
+                and dto[10] == ' '):
+            return datetime.datetime(int(dto[0:4]), int(dto[5:7]), int(dto[8:10]),
+                                     int(dto[11:13]), int(dto[14:16]), int(dto[17:19]))
+        return datetime.datetime.strptime(dto, '%Y:%m:%d %H:%M:%S')
+    except (ValueError, TypeError):
+        return None
+
+
+_PLACES_CACHE_SIZE = 4096
+_PLACES_CACHE: "OrderedDict[Tuple[float, float], tuple]" = OrderedDict()
+
+
+def _places_for(lat: float, lon: float) -> Tuple["geoutil.PlaceInfo", ...]:
+    """Nearby places for a coordinate, memoized per ~10 m cell.
+
+    The cell only keys the cache; the first lookup in a cell queries with
+    the exact coordinate so GeoUtil's own cache keys are unchanged.
+    """
+    key = (round(lat, 4), round(lon, 4))
+    places = _PLACES_CACHE.get(key)
+    if places is not None:
+        _PLACES_CACHE.move_to_end(key)
+        return places
+    import lib.gui.geoutil as geoutil
+    geo_util = geoutil.get_singleton_geo_util()
+    places = tuple(geo_util.get_nearby_places(lat=lat, lng=lon) or ())
+    _PLACES_CACHE[key] = places
+    if len(_PLACES_CACHE) > _PLACES_CACHE_SIZE:
+        _PLACES_CACHE.popitem(last=False)
+    return places
+
+
 class ImageInfo():
     """Simple container for image filename and metadata dictionary."""
 
+    __slots__ = ('filename', '_metadata', '_dt_cached', '_places', '_ctx_cache')
+
     def __init__(self, filename: str = None, metadata: dict = None):
         self.filename = filename
         self.metadata = metadata if metadata is not None else {}
 
+    @property
+    def metadata(self) -> dict:
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: dict) -> None:
+        # Derived values are cached per metadata dict
+        self._metadata = value
+        self._dt_cached = _UNSET
+        self._places: Optional[List["geoutil.PlaceInfo"]] = None
+        self._ctx_cache: dict = {}
+
     @property
     def datetime_original(self) -> Optional[datetime.datetime]:
         """Return the DateTimeOriginal datetime from metadata or None."""
-        dto = self.metadata.get("DateTimeOriginal", None)
-        if dto is not None and isinstance(dto, bytes):
-            try:
-                dto = dto.decode('utf-8')
-            except Exception:
-                dto = str(dto)
-        if dto:
-            try:
-                return datetime.datetime.strptime(dto, '%Y:%m:%d %H:%M:%S')
-            except (ValueError, TypeError):
-                return None
-        return None
+        if self._dt_cached is _UNSET:
+            self._dt_cached = _parse_exif_datetime(
+                self.metadata.get("DateTimeOriginal", None))
+        return self._dt_cached
 
     @property
-    def places(self) -> List[geoutil.PlaceInfo]:
+    def places(self) -> List["geoutil.PlaceInfo"]:
         """Return a list of places associated with the image metadata."""
-        geo_util = geoutil.get_singleton_geo_util()
-        lat = self.metadata.get("GPSLatitude", None)
-        lon = self.metadata.get("GPSLongitude", None)
-        if lat is not None and lon is not None:
-            places = geo_util.get_nearby_places(lat=lat, lng=lon)
-            if places:
-                return places
-        return []
+        if self._places is None:
+            lat = self.metadata.get("GPSLatitude", None)
+            lon = self.metadata.get("GPSLongitude", None)
+            places = []
+            if lat is not None and lon is not None:
+                places = list(_places_for(lat, lon))
+            self._places = places
+        return self._places
 
     def __str__(self):
         return f"ImageInfo(filename={self.filename}, metadata={self.metadata})"
 
 
+def is_image_path(path: str) -> bool:
+    """Return True if `path` has one of the supported image extensions."""
+    return os.path.splitext(path)[1].lower() in FilesManager.IMAGES
+
+
+_BITMAP_CACHE_SIZE = 64
+_BITMAP_CACHE: "OrderedDict[tuple, wx.Bitmap]" = OrderedDict()
+# Worker threads for thumbnail decoding; PIL releases the GIL while decoding
+_THUMB_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="thumbnail")
+
+
+def _bitmap_key(path: str, size: Tuple[int, int]) -> Optional[tuple]:
+    """Cache key for `path` at `size`, or None if the file can't be stat'ed."""
+    try:
+        return (os.path.abspath(path), os.stat(path).st_mtime_ns, *size)
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def _cached_bitmap(key: Optional[tuple]) -> Optional[wx.Bitmap]:
+    if key is None:
+        return None
+    bmp = _BITMAP_CACHE.get(key)
+    if bmp is not None:
+        _BITMAP_CACHE.move_to_end(key)
+    return bmp
+
+
+def _store_bitmap(key: Optional[tuple], bmp: wx.Bitmap) -> None:
+    if key is None:
+        return
+    _BITMAP_CACHE[key] = bmp
+    if len(_BITMAP_CACHE) > _BITMAP_CACHE_SIZE:
+        _BITMAP_CACHE.popitem(last=False)
+
+
+def _decode_thumbnail(key: tuple) -> Optional[Tuple[int, int, bytes]]:
+    """Decode the image named by a `_bitmap_key` into RGB bytes.
+
+    Safe to run off the UI thread: only PIL and the filesystem are used.
+    Images inside the project also get a PNG thumbnail under .thumbs that
+    is reused until the source file is modified. Returns None if PIL can't
+    read the image.
+    """
+    path, mtime_ns, width, height = key
+    size = (width, height)
+
+    thumb = None
+    try:
+        fm = FilesManager.instance()
+        if fm.is_managed_file(path):
+            thumb = fm.get_thumbnail_path(path, size)
+    except Exception:
+        thumb = None
+
+    try:
+        if thumb is not None and thumb.exists() and thumb.stat().st_mtime_ns >= mtime_ns:
+            with PIL.Image.open(thumb) as im:
+                im = im.convert("RGB")
+        else:
+            with PIL.Image.open(path) as im:
+                # Let libjpeg decode at 1/2, 1/4 or 1/8 scale when it can
+                im.draft("RGB", size)
+                im = im.convert("RGB").resize(size, PIL.Image.Resampling.BILINEAR)
+            if thumb is not None:
+                try:
+                    im.save(thumb)
+                except OSError:
+                    pass
+        return im.width, im.height, im.tobytes()
+    except Exception:
+        return None
+
+
+def _bitmap_from_rgb(path: str, size: Tuple[int, int], rgb: Optional[Tuple[int, int, bytes]]) -> wx.Bitmap:
+    """Build a wx.Bitmap on the UI thread, falling back to wx's own decoder."""
+    if rgb is not None:
+        return wx.Bitmap.FromBuffer(*rgb)
+    img = wx.Image(path, wx.BITMAP_TYPE_ANY)
+    if not img.IsOk():
+        # Neither PIL nor wx could read it; show an empty thumbnail
+        return wx.Bitmap(*size)
+    img = img.Scale(*size)
+    return wx.Bitmap(img)
+
+
 class ImageButton(wx.Button):
     """Button control that displays an image and allows changing it.
 
@@ -196,19 +523,18 @@ class ImageButton(wx.Button):
         if image:
             self._filename = FilesManager.instance().add_file(image)
             self._metadata = get_image_metadata(self._filename)
-            img = wx.Image(self._filename, wx.BITMAP_TYPE_ANY)
-            img = img.Scale(*self._size)
-            bmp = wx.Bitmap(img)
+            self._load_bitmap()
         else:
-            bmp = wx.Bitmap(*self._size)
+            self.ResetBitmap()
+        # Shared by every image_info access so its derived values stay cached
+        self._image_info = ImageInfo(filename=self._filename, metadata=self._metadata)
 
-        self.SetBitmap(bmp)
         self.Bind(wx.EVT_BUTTON, self.on_set_image)
 
     def on_set_image(self, event) -> None:
         """Open a file chooser to select a new image and set it."""
         path = OpenDialog.ChoseFile(self, "Choose Image", OpenDialog.IMAGES)
-        if path:
+        if path and is_image_path(path):
             self.set_image(path)
 
     def set_image(self, filename: str) -> None:
@@ -217,14 +543,13 @@ class ImageButton(wx.Button):
             self.ResetBitmap()
             self._filename = None
             self._metadata = {}
+            self._image_info = ImageInfo()
             return
         self._filename = FilesManager.instance().add_file(filename)
         self._metadata = get_image_metadata(self._filename)
+        self._image_info = ImageInfo(filename=self._filename, metadata=self._metadata)
 
-        img = wx.Image(self._filename, wx.BITMAP_TYPE_ANY)
-        img = img.Scale(*self._size)
-        bmp = wx.Bitmap(img)
-        self.SetBitmap(bmp)
+        self._load_bitmap()
         # Ensure the control and its parent are redrawn/laid out so bitmap and metadata are visible
         try:
             self.Refresh()
@@ -237,10 +562,46 @@ class ImageButton(wx.Button):
         except Exception:
             pass
 
+    def _load_bitmap(self) -> None:
+        """Show the current image, decoding it on a worker thread if needed.
+
+        A blank bitmap is shown until the decode finishes; results for an
+        image that has since been replaced are dropped.
+        """
+        filename = self._filename
+        key = _bitmap_key(filename, self._size)
+        bmp = _cached_bitmap(key)
+        if bmp is not None:
+            self.SetBitmap(bmp)
+            return
+        if key is None:
+            self.SetBitmap(_bitmap_from_rgb(filename, self._size, None))
+            return
+
+        self.ResetBitmap()
+        future = _THUMB_EXECUTOR.submit(_decode_thumbnail, key)
+        future.add_done_callback(
+            lambda f: wx.CallAfter(self._on_thumbnail_ready, filename, key, f))
+
+    def _on_thumbnail_ready(self, filename: str, key: tuple, future: concurrent.futures.Future) -> None:
+        try:
+            rgb = future.result()
+        except Exception:
+            rgb = None
+        bmp = _cached_bitmap(key)
+        if bmp is None:
+            bmp = _bitmap_from_rgb(filename, self._size, rgb)
+            _store_bitmap(key, bmp)
+        # The control may have been destroyed or pointed at another image
+        if not self or self._filename != filename:
+            return
+        self.SetBitmap(bmp)
+        self.Refresh()
+
     @property
     def image_info(self) -> ImageInfo:
-        """Return an ImageInfo object with the current filename and metadata."""
-        return ImageInfo(filename=self._filename, metadata=self._metadata)
+        """Return the ImageInfo for the current filename and metadata."""
+        return self._image_info
 
     @property
     def metadata(self) -> dict:
@@ -289,10 +650,15 @@ class Text(wx.TextCtrl):
             return
         lines: int = self.GetNumberOfLines()
         if lines > self._lines:
-            # Get the content of the TextCtrl up to the third line
+            # Keep the content of the TextCtrl up to the N-th newline
             value: str = self.GetValue()
-            content: List[str] = value.splitlines()[:self._lines]
-            self.SetValue("\n".join(content))
+            idx = -1
+            for _ in range(self._lines):
+                idx = value.find("\n", idx + 1)
+                if idx < 0:
+                    # Extra lines come from wrapping, nothing to cut
+                    return
+            self.SetValue(value[:idx])
             self.SetInsertionPointEnd()  # Move cursor to the end
 
 
@@ -310,19 +676,24 @@ class NumberText(Text):
         if not value_str:
             value_str = ""
 
-        try:
-            if value_str:
-                value = int(value_str)
-            else:
-                value = 0
-            if self._on_change:
-                self._on_change(value)
-            self._last_value = value
-        except:
+        if value_str and not _INT_RE.fullmatch(value_str):
+            # Reject typos without paying for a ValueError
             value_str = str(self._last_value)
+        else:
+            try:
+                if value_str:
+                    value = int(value_str)
+                else:
+                    value = 0
+                if self._on_change:
+                    self._on_change(value)
+                self._last_value = value
+            except:
+                value_str = str(self._last_value)
 
         if value_str != val:
-            self.SetValue(value_str)
+            # ChangeValue emits no EVT_TEXT, so this doesn't re-enter _validate
+            self.ChangeValue(value_str)
         super()._validate(event)
 
 class ScrolledPanel(scrolled.ScrolledPanel):
@@ -338,6 +709,41 @@ class ScrolledPanel(scrolled.ScrolledPanel):
         self.SetupScrolling()
         self._sizer = wx.BoxSizer(wx.VERTICAL)
         self.SetSizer(self._sizer)
+        # Nesting depth of bulk_update(); layout is deferred while > 0
+        self._bulk = 0
+        # A coalesced Refresh is queued for the next event-loop iteration
+        self._pending_refresh = False
+
+    @contextlib.contextmanager
+    def bulk_update(self):
+        """Freeze the panel and defer layout until the block exits.
+
+        Add()/Insert() calls made inside the block only touch the sizer;
+        a single Refresh() runs when the outermost block finishes.
+        """
+        if self._bulk == 0:
+            self.Freeze()
+        self._bulk += 1
+        try:
+            yield self
+        finally:
+            self._bulk -= 1
+            if self._bulk == 0:
+                try:
+                    self.Refresh()
+                finally:
+                    self.Thaw()
+
+    def _schedule_refresh(self) -> None:
+        """Collapse a burst of Add() calls into a single Refresh."""
+        if not self._pending_refresh:
+            self._pending_refresh = True
+            wx.CallAfter(self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._pending_refresh = False
+        if self:
+            self.Refresh()
 
     def Items(self) -> List[wx.Window]:
         """Return the list of child window objects currently in the sizer."""
@@ -345,14 +751,14 @@ class ScrolledPanel(scrolled.ScrolledPanel):
 
     def Insert(self, items: List[wx.Window]) -> None:
         """Insert one or more windows into the sizer."""
-        for item in items:
-            self._sizer.Add(item)
-        self.Refresh()
+        with self.bulk_update():
+            self._sizer.AddMany(items)
 
     def Add(self, item: wx.Window) -> None:
         """Add a single window to the sizer and refresh the panel."""
         self._sizer.Add(item)
-        self.Refresh()
+        if not self._bulk:
+            self._schedule_refresh()
 
     def Refresh(self, eraseBackground: bool = True, rect: Any = None):
         self.Layout()
@@ -361,22 +767,17 @@ class ScrolledPanel(scrolled.ScrolledPanel):
 
     def clear(self) -> None:
         """Remove and destroy all child widgets from the sizer."""
-        self._sizer.Clear(True)
-        self.Refresh()
+        with self.bulk_update():
+            self._sizer.Clear(True)
 
     def Sort(self, key) -> None:
         """Sort child widgets in the sizer using the provided key function."""
-        children: List[wx.SizerItem] = self._sizer.GetChildren()
-        items = []
-        for child in children:
-            widget = child.GetWindow()
-            items.append(widget)
-            self._sizer.Detach(widget)
-
-        sortedItems = sorted([it for it in items], key=key)
-        for item in sortedItems:
-            self._sizer.Add(item)
-        self.Refresh()
+        with self.bulk_update():
+            children: List[wx.SizerItem] = self._sizer.GetChildren()
+            items = [(child.GetWindow(), key(child.GetWindow())) for child in children]
+            items.sort(key=lambda it: it[1])
+            self._sizer.Clear(False)
+            self._sizer.AddMany([it[0] for it in items])
 
     def Remove(self, item: wx.Window):
         """Detach a child widget from the sizer without destroying it."""
@@ -384,40 +785,67 @@ class ScrolledPanel(scrolled.ScrolledPanel):
 
 
 class OpenDialog:
-    IMAGES = "Image files (*.png;*.jpg;*.jpeg;*.bmp)|*.png;*.jpg;*.jpeg;*.bmp"
+    _IMAGE_GLOB = ";".join("*" + ext for ext in sorted(FilesManager.IMAGES))
+    IMAGES = f"Image files ({_IMAGE_GLOB})|{_IMAGE_GLOB}"
     JSON = "Project files (*.json)|*.json"
     ICS = "ICS files (*.ics)|*.ics"
 
+    # (dialog class, title, wildcard, style) -> live dialog
+    _DIALOG_CACHE: dict = {}
+
     def __init__(self):
         pass
 
+    @staticmethod
+    def _dialog(cls, parent, title, wildcard, style):
+        """Return a reusable dialog for the given arguments.
+
+        Dialogs are owned by the top-level window of `parent` rather than by
+        `parent` itself, so controls sharing a frame share one dialog. A
+        destroyed entry is detected and rebuilt on the next request.
+        """
+        owner = wx.GetTopLevelParent(parent) if parent else None
+        key = (cls, title, wildcard, style)
+        dialog = OpenDialog._DIALOG_CACHE.get(key)
+        if not dialog:
+            dialog = cls(owner, title, wildcard=wildcard, style=style)
+            OpenDialog._DIALOG_CACHE[key] = dialog
+        elif owner is not None and dialog.GetParent() != owner:
+            dialog.Reparent(owner)
+        return dialog
+
     @staticmethod
     def ChoseFile(parent, title, wildcard="", style=wx.FD_OPEN) -> str:
         """Open a file chooser and return the selected path or None."""
-        fileDialog: wx.FileDialog = None
-        with wx.FileDialog(parent, title, wildcard=wildcard, style=style) as fileDialog:
-            if fileDialog.ShowModal() == wx.ID_OK:
-                return fileDialog.GetPath()
+        fileDialog = OpenDialog._dialog(wx.FileDialog, parent, title, wildcard, style)
+        if fileDialog.ShowModal() == wx.ID_OK:
+            return fileDialog.GetPath()
         return None
 
     @staticmethod
     def ChoseFiles(parent, title, wildcard="", style=wx.FD_OPEN | wx.FD_MULTIPLE) -> List[str]:
         """Open a multi-file chooser and return the selected paths or None."""
-        fileDialog: wx.FileDialog = None
-        with wx.FileDialog(parent, title, wildcard=wildcard, style=style) as fileDialog:
-            if fileDialog.ShowModal() == wx.ID_OK:
-                return fileDialog.GetPaths()
+        fileDialog = OpenDialog._dialog(wx.FileDialog, parent, title, wildcard, style)
+        if fileDialog.ShowModal() == wx.ID_OK:
+            return fileDialog.GetPaths()
         return None
 
     @staticmethod
     def ChoseDir(parent, title, wildcard="", style=wx.DD_DEFAULT_STYLE) -> str:
         """Open a directory chooser and return the selected path or None."""
-        dirDialog: wx.DirDialog = None
-        with wx.DirDialog(parent, title, wildcard=wildcard, style=style) as dirDialog:
-            if dirDialog.ShowModal() == wx.ID_OK:
-                return dirDialog.GetPath()
+        dirDialog = OpenDialog._dialog(wx.DirDialog, parent, title, wildcard, style)
+        if dirDialog.ShowModal() == wx.ID_OK:
+            return dirDialog.GetPath()
         return None
 
+    @staticmethod
+    def destroy_cached() -> None:
+        """Destroy every cached dialog (e.g. when the main frame closes)."""
+        for dialog in OpenDialog._DIALOG_CACHE.values():
+            if dialog:
+                dialog.Destroy()
+        OpenDialog._DIALOG_CACHE.clear()
+
 
 class MainFrame(wx.Frame):
     def __init__(self, *args, **kw):
@@ -441,17 +869,16 @@ class TextTemplate:
         is applied. Otherwise the value is converted to string.
         Missing keys render as empty strings.
         """
-        import re
         text = self.template or ""
-        if not text:
+        if "{" not in text:
             return text
 
-        pattern = r"\{([A-Za-z0-9_.]+)(?::([^}]+))?\}"
+        get = context.get
 
         def replace(m: re.Match) -> str:
             key = m.group(1)
             fmt = m.group(2)
-            value = context.get(key, "")
+            value = get(key, "")
             # Normalize NaN floats
             try:
                 if isinstance(value, float) and value != value:
@@ -465,7 +892,7 @@ class TextTemplate:
                     return ""
             return "" if value is None else str(value)
 
-        return re.sub(pattern, replace, text)
+        return _TEMPLATE_RE.sub(replace, text)
 
 
 def extract_place_info(image_info: ImageInfo, selected_place_index: int = 0, overrides: dict = None) -> dict:
@@ -484,6 +911,23 @@ def extract_place_info(image_info: ImageInfo, selected_place_index: int = 0, ove
     Returns:
         dict mapping placeholder keys to string values.
     """
+    cache = getattr(image_info, "_ctx_cache", None)
+    key = None
+    if cache is not None:
+        try:
+            key = (selected_place_index, frozenset((overrides or {}).items()))
+        except TypeError:
+            key = None
+        if key is not None and key in cache:
+            return cache[key].copy()
+
+    ctx = _build_place_info(image_info, selected_place_index, overrides)
+    if key is not None:
+        cache[key] = ctx.copy()
+    return ctx
+
+
+def _build_place_info(image_info: ImageInfo, selected_place_index: int, overrides: dict) -> dict:
     ctx = {
         "place.name": "",
         "place.city": "",
@@ -1,11 +1,11 @@
 """Common HTML helpers shared by desk and wall calendar views.
 
-Provides reusable fragments and utilities for rendering front pages and
-moon phase overlays. This avoids duplication across deskcal_html and
+Provides reusable fragments and utilities for rendering front pages,
+month grids and moon phase overlays. This avoids duplication across deskcal_html and
 wallcal_html while keeping module-specific encoders minimal.
 """
 
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 from xml.etree import ElementTree as ET
 
 try:
@@ -20,6 +20,16 @@ import lib.html.htmlutil as _libhtml
 from lib.calendar.moon_calendar import _MoonCalendar
 
 
+# Constant attribute dicts; Element copies attrib on construction so these
+# are never mutated by the tags built from them.
+_MOON_ATTRIB = {'class': 'cell-moon-overlay'}
+_PAGE_ATTRIB = {'class': 'page-letter-landscape'}
+_FRONT_PAGE_ATTRIB = {'class': 'front-page'}
+_FRONT_PAGE_IMG_ATTRIB = {'class': 'front-page-img'}
+_FRONT_PAGE_TITLE_ATTRIB = {'class': 'front-page-title'}
+_PAGE_BREAK_ATTRIB = {'class': 'page-break'}
+
+
 class MoonPhaseImages:
     """Provide file paths for moon-phase overlay images used in cells.
 
@@ -31,18 +41,16 @@ class MoonPhaseImages:
     FULL_MOON_PATH = "images/moon-phases/full-moon.png"
     THIRD_QUARTER_PATH = "images/moon-phases/third-quarter.png"
 
+    _PHASE_MAP = {
+        _MoonCalendar.NEW_MOON: NEW_MOON_PATH,
+        _MoonCalendar.FIRST_QUARTER: FIRST_QUARTER_PATH,
+        _MoonCalendar.FULL_MOON: FULL_MOON_PATH,
+        _MoonCalendar.THIRD_QUARTER: THIRD_QUARTER_PATH,
+    }
+
     @staticmethod
     def image(phase) -> Optional[str]:
-        moon_path = None
-        if phase == _MoonCalendar.NEW_MOON:
-            moon_path = MoonPhaseImages.NEW_MOON_PATH
-        elif phase == _MoonCalendar.FIRST_QUARTER:
-            moon_path = MoonPhaseImages.FIRST_QUARTER_PATH
-        elif phase == _MoonCalendar.FULL_MOON:
-            moon_path = MoonPhaseImages.FULL_MOON_PATH
-        elif phase == _MoonCalendar.THIRD_QUARTER:
-            moon_path = MoonPhaseImages.THIRD_QUARTER_PATH
-        return moon_path
+        return MoonPhaseImages._PHASE_MAP.get(phase)
 
 
 def moon_phase_element(phase) -> Optional[ET.Element]:
@@ -51,9 +59,9 @@ def moon_phase_element(phase) -> Optional[ET.Element]:
     The element uses CSS class 'cell-moon-overlay' consistent with both
     desk and wall calendar layouts.
     """
-    img = MoonPhaseImages.image(phase)
+    img = MoonPhaseImages._PHASE_MAP.get(phase)
     if img:
-        return _libhtml.HtmlTag('img', attrib={'class': 'cell-moon-overlay', 'src': img})
+        return _libhtml.HtmlTag('img', attrib={**_MOON_ATTRIB, 'src': img})
     return None
 
 
@@ -69,12 +77,42 @@ def front_page_element(front_page: _libcal.FrontPage) -> ET.Element:
           <div class="page-break"></div>
         </div>
     """
-    page = _libhtml.HtmlTag('div', attrib={'class': 'page-letter-landscape'})
-    fp = page.add('div', attrib={'class': 'front-page'})
+    page = _libhtml.HtmlTag('div', attrib=_PAGE_ATTRIB)
+    fp = page.add('div', attrib=_FRONT_PAGE_ATTRIB)
     if getattr(front_page, 'image', None):
-        fp.add('img', attrib={'class': 'front-page-img', 'src': front_page.image})
+        fp.add('img', attrib={**_FRONT_PAGE_IMG_ATTRIB, 'src': front_page.image})
     if getattr(front_page, 'title', None):
-        title = fp.add('div', attrib={'class': 'front-page-title'})
+        title = fp.add('div', attrib=_FRONT_PAGE_TITLE_ATTRIB)
         title.add('p', text=front_page.title)
-    page.add('div', attrib={'class': 'page-break'})
+    page.add('div', attrib=_PAGE_BREAK_ATTRIB)
     return page
+
+
+def month_element(month: _libcal.Month, encoder: _libhtml.HtmlEncoder, *,
+                  page_attr: dict, header_text: str, header_attr: dict,
+                  weekdays: Iterable[str], day_header_attr: dict,
+                  grid_attr: dict, month_attr: Optional[dict] = None,
+                  weekday_row_attr: Optional[dict] = None
+                  ) -> Tuple[ET.Element, ET.Element]:
+    """Build the month header, weekday row and day grid shared by both views.
+
+    `month_attr` adds a wrapper inside the page; `weekday_row_attr` puts
+    the weekday headings in their own row instead of at the top of the
+    grid. Returns (page, body) where body is the node holding the grid so
+    callers can append layout-specific trailers.
+    """
+    page = _libhtml.HtmlTag('div', attrib=page_attr)
+    body = page.add('div', attrib=month_attr) if month_attr else page
+    body.add('div', text=header_text, attrib=header_attr)
+
+    if weekday_row_attr:
+        row = body.add('div', attrib=weekday_row_attr)
+        grid = body.add('div', attrib=grid_attr)
+    else:
+        grid = row = body.add('div', attrib=grid_attr)
+    for day in weekdays:
+        row.add('div', text=day, attrib=day_header_attr)
+
+    to_html = encoder.to_html
+    grid.extend([to_html(c) for week in month.table[1] for c in week])
+    return page, body
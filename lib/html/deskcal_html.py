@@ -7,6 +7,7 @@ wallcal_html but targets a compact, desk-oriented layout.
 """
 
 from xml.etree import ElementTree as ET
+from typing import Iterator, TextIO
 import pathlib
 
 try:
@@ -24,6 +25,17 @@ from lib.calendar.moon_calendar import _MoonCalendar
 
 HtmlEncoder = _libhtml.HtmlEncoder()
 
+# Constant attribute dicts for the per-cell/per-month tags. Element copies
+# attrib on construction, so the tags never share or mutate these.
+_CELL_ATTR = {'class': 'month-day-cell'}
+_CELL_DAY_ATTR = {'class': 'cell-text-day'}
+_MONTH_PAGE_ATTR = {'class': 'month-page'}
+_MONTH_HEADER_ATTR = {'class': 'month-header'}
+_GRID_ATTR = {'class': 'month-calendar-container'}
+_DAY_HEADER_ATTR = {'class': 'month-day-header'}
+_DESCRIPTION_ATTR = {'class': 'month-description'}
+_DESK_PAGE_ATTR = {'class': 'desk-page'}
+
 class CssResources:
     CSS_DIR = "css"
     CALENDAR_CSS = str(pathlib.Path(CSS_DIR, "desk_calendar.css"))
@@ -75,14 +87,12 @@ def CellHtml(self: _libcal.Day) -> ET.Element:
     The returned element contains the numeric day and may include an
     overlay image or text if the model provides photo, text or moon_phase.
     """
-    attrib = {'class': 'month-day-cell'}
-    cell = _libhtml.HtmlTag('div', attrib=attrib)
+    cell = _libhtml.HtmlTag('div', attrib=_CELL_ATTR)
     # if self.photo:
     #     cell.add('img', attrib={'class': 'cell-photo-overlay',
     #                             'src': self._photo})
     if self.day:
-        cell.add('div', text=str(self._day),
-                 attrib={'class': 'cell-text-day'})
+        cell.add('div', text=str(self._day), attrib=_CELL_DAY_ATTR)
     # if self.text:
     #     cell.add('div', text=str(self._text),
     #              attrib={'class': 'cell-text-overlay'})
@@ -98,24 +108,15 @@ def MonthHtml(self: _libcal.Month) -> ET.Element:
     The returned element is a container for the month name and a compact
     grid of day cells suitable for the desk calendar pages.
     """
-    page = _libhtml.HtmlTag('div', attrib={'class': 'month-page'})
-
-    page.add('div', text=f"{self.name} {self.year}",
-            attrib={'class': 'month-header'})
-
-    grid = page.add('div', attrib={'class': 'month-calendar-container'})
-    _days, _cells = self.table
-    for day in _days:
-        grid.add('div', text=day[:3], attrib={'class': 'month-day-header'})
-
-    # grid = page.add(
-    #     'div', attrib={'class': 'container'})
-    for row in _cells:
-        for c in row:
-            grid.append(HtmlEncoder.to_html(c))
+    page, _ = _common.month_element(
+        self, HtmlEncoder,
+        page_attr=_MONTH_PAGE_ATTR,
+        header_text=f"{self.name} {self.year}", header_attr=_MONTH_HEADER_ATTR,
+        weekdays=self.short_weekday_headers,
+        day_header_attr=_DAY_HEADER_ATTR, grid_attr=_GRID_ATTR)
     # text = page.add(
     #     'div', attrib={'class': 'container'})
-    desc = page.add("div", attrib={'class':'month-description'})
+    desc = page.add("div", attrib=_DESCRIPTION_ATTR)
     desc.add('p', text="Hello world\nApr 25")
     return page
 
@@ -129,48 +130,67 @@ def CalendarHtml(self: _libcal.Calendar) -> ET.Element:
     document by the WallCalendar.__html__ wrapper.
     """
     cal = _libhtml.HtmlTag('div', attrib={'class': 'calendar'})
-    # cal.append(HtmlEncoder.to_html(self.front_page))
-    for mi in self.pages:
-        page = _libhtml.HtmlTag('div', attrib={'class':'desk-page'})
-        page.append(HtmlEncoder.to_html(mi.art))
-        page.append(HtmlEncoder.to_html(mi.month))
-        cal.append(page)
-        # break
+    cal.extend(_calendar_pages(self))
     return cal
 
 
+def _calendar_pages(calendar: _libcal.Calendar) -> Iterator[ET.Element]:
+    """Yield one desk page (artwork plus month grid) per calendar month."""
+    to_html = HtmlEncoder.to_html
+    # yield to_html(calendar.front_page)
+    for mi in calendar.pages:
+        page = _libhtml.HtmlTag('div', attrib=_DESK_PAGE_ATTR)
+        page.append(to_html(mi.art))
+        page.append(to_html(mi.month))
+        yield page
+
+
 class WallCalendar:
     """Generate a complete HTML document for a desk calendar instance.
 
     The object wraps a lib.pycal.Calendar and exposes __html__ returning
-    an ElementTree for writing to disk. CSS file locations are provided
+    an ElementTree, or write() to stream the document to a file. CSS file locations are provided
     by CssResources.
     """
     def __init__(self, calendar: _libcal.Calendar):
         self._calendar = calendar
 
-    def __html__(self) -> ET.ElementTree:
-        root = _libhtml.HtmlTag("html")
-        head = root.add("head")
+    def _head(self) -> ET.Element:
+        head = _libhtml.HtmlTag("head")
         head.add('title', text='Calendar')
         head.add('link', attrib={'rel': "stylesheet",
                  'href': CssResources.CALENDAR_CSS})
         head.add('link', attrib={
             'rel': "stylesheet", 'type': 'text/css', 'media': 'print', 'href': CssResources.PRINT_CSS})
+        return head
+
+    def __html__(self) -> ET.ElementTree:
+        root = _libhtml.HtmlTag("html")
+        root.append(self._head())
 
         body = root.add('body', attrib={'class': 'main'})
 
         body.append(HtmlEncoder.to_html(self._calendar))
         return ET.ElementTree(root)
 
+    def write(self, fp: TextIO) -> None:
+        """Stream the document to `fp` one page at a time.
+
+        Produces the same markup as serializing __html__(), but only one
+        page fragment is built and held in memory at any point.
+        """
+        writer = _libhtml.HtmlWriter(fp)
+        writer.write("<html>")
+        writer.element(self._head())
+        writer.write('<body class="main"><div class="calendar">')
+        for page in _calendar_pages(self._calendar):
+            writer.element(page)
+        writer.write("</div></body></html>")
+
 
 if __name__ == "__main__":
     import lib.calendar.ics_loader as _libics
     import sys
     cal = _libcal.Calendar(year=2025, events=_libcal.EventsManager(
         2025, birthdays=_libics.TestVCalendar()))
-    cal = WallCalendar(cal)
-    root = HtmlEncoder.to_html(cal)
-
-    root.write(sys.stdout, encoding='unicode',
-               method='html')
+    WallCalendar(cal).write(sys.stdout)
@@ -2,11 +2,14 @@
 
 HtmlTag is a thin Element subclass that makes creating nested tags easier.
 HtmlEncoder is a small registry that maps Python types to functions that
-produce HTML fragments (Element instances) for those types.
+produce HTML fragments (Element instances) for those types. HtmlWriter
+serializes those fragments straight into a text buffer.
 """
 
 from xml.etree import ElementTree as ET
-from typing import Dict, Any
+from typing import Dict, Any, TextIO, Union
+import functools
+import io
 
 
 class HtmlTag(ET.Element):
@@ -15,6 +18,8 @@ class HtmlTag(ET.Element):
     HtmlTag(tag, attrib, text) builds an Element and provides an add()
     helper that appends and returns a new HtmlTag child.
     """
+    __slots__ = ()
+
     def __init__(self, tag: str, attrib={}, text: str = None, **extra):
         super().__init__(tag, attrib, **extra)
         if text:
@@ -36,19 +41,18 @@ class HtmlEncoder:
     """
     def __init__(self):
         self._handles = {}
+        # The registry dict is never replaced, so its lookup is bound once
+        self._get_handler = self._handles.get
 
     def to_html(self, obj):
-        type_ = type(obj)
-        ret = None
-        if type_ in self._handles:
-            ret = self._handles[type_](obj)
+        handler = self._get_handler(type(obj))
+        if handler is not None:
+            ret = handler(obj)
         elif hasattr(obj, '__html__'):
             ret = obj.__html__()
         else:
-            raise ValueError(f"Unsuported Type {type_}")
-        if ret is None:
-            ret = HtmlTag(tag="div")
-        return ret
+            raise ValueError(f"Unsuported Type {type(obj)}")
+        return ret if ret is not None else HtmlTag(tag="div")
 
     def override(self, _type: type):
         """Decorator to register a handler for `_type`.
@@ -63,3 +67,84 @@ class HtmlEncoder:
             return func
         return handler
 
+
+# Void elements never get a closing tag under method="html"
+_HTML_EMPTY = frozenset(ET.HTML_EMPTY)
+_RAW_TEXT = frozenset(("script", "style"))
+
+
+def _escape_cdata(text: str) -> str:
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def _escape_attrib(value: str) -> str:
+    if "&" in value:
+        value = value.replace("&", "&amp;")
+    if ">" in value:
+        value = value.replace(">", "&gt;")
+    if "\"" in value:
+        value = value.replace("\"", "&quot;")
+    return value
+
+
+@functools.lru_cache(maxsize=512)
+def _render_attrs(items: tuple) -> str:
+    """Render ((name, value), ...) as ' name="value"...' in the given order.
+
+    Calendars repeat the same few class attributes on hundreds of cells,
+    so the escaped fragments are memoized.
+    """
+    return "".join(f' {k}="{_escape_attrib(v)}"' for k, v in items)
+
+
+class HtmlWriter:
+    """Serialize HtmlTag/Element trees as HTML into a text buffer.
+
+    Output matches ElementTree.write(method="html", encoding="unicode") but
+    goes straight to a StringIO (or any text file) through a bound write(),
+    skipping ElementTree's generic namespace and qname bookkeeping.
+    """
+    def __init__(self, fp: TextIO = None):
+        self.buf = fp if fp is not None else io.StringIO()
+        self.write = self.buf.write
+
+    def element(self, elem: Union[ET.Element, ET.ElementTree]) -> None:
+        """Write `elem` (or the root of an ElementTree) and its children."""
+        if isinstance(elem, ET.ElementTree):
+            elem = elem.getroot()
+        self._element(elem)
+
+    def _element(self, elem: ET.Element) -> None:
+        write = self.write
+        tag = elem.tag
+        items = elem.items()
+        if items:
+            write("<" + tag + _render_attrs(tuple(items)) + ">")
+        else:
+            write("<" + tag + ">")
+        ltag = tag.lower()
+        text = elem.text
+        if text:
+            write(text if ltag in _RAW_TEXT else _escape_cdata(text))
+        for child in elem:
+            self._element(child)
+        if ltag not in _HTML_EMPTY:
+            write("</" + tag + ">")
+        if elem.tail:
+            write(_escape_cdata(elem.tail))
+
+    def getvalue(self) -> str:
+        return self.buf.getvalue()
+
+
+def tostring(elem: Union[ET.Element, ET.ElementTree]) -> str:
+    """Return `elem` serialized as HTML using HtmlWriter."""
+    writer = HtmlWriter()
+    writer.element(elem)
+    return writer.getvalue()
@@ -7,6 +7,7 @@ wall calendars.
 """
 
 from xml.etree import ElementTree as ET
+from typing import Iterator, TextIO
 import pathlib
 
 try:
@@ -23,6 +24,20 @@ from lib.calendar.moon_calendar import _MoonCalendar
 
 HtmlEncoder = _libhtml.HtmlEncoder()
 
+# Constant attribute dicts for the per-cell/per-month tags. Element copies
+# attrib on construction, so the tags never share or mutate these.
+_CELL_ATTR = {'class': 'cell'}
+_CELL_DAY_ATTR = {'class': 'cell-text-day'}
+_CELL_PHOTO_ATTR = {'class': 'cell-photo-overlay'}
+_CELL_TEXT_ATTR = {'class': 'cell-text-overlay'}
+_PAGE_ATTR = {'class': 'page-letter-landscape'}
+_MONTH_ATTR = {'class': 'month'}
+_MONTH_HEADER_ATTR = {'class': 'month-header'}
+_CONTAINER_ATTR = {'class': 'container'}
+_DAY_HEADER_ATTR = {'class': 'month-day-header'}
+_GRID_ATTR = {'class': 'container', 'style': 'border: 1px solid black;'}
+_PAGE_BREAK_ATTR = {'class': 'page-break'}
+
 class CssResources:
     CSS_DIR = "css"
     CALENDAR_CSS = str(pathlib.Path(CSS_DIR, "calendar.css"))
@@ -76,17 +91,13 @@ def CellHtml(self: _libcal.Day) -> ET.Element:
     Includes optional photo, text overlay and moon-phase image when
     provided by the Day model.
     """
-    attrib = {'class': 'cell'}
-    cell = _libhtml.HtmlTag('div', attrib=attrib)
+    cell = _libhtml.HtmlTag('div', attrib=_CELL_ATTR)
     if self.photo:
-        cell.add('img', attrib={'class': 'cell-photo-overlay',
-                                'src': self._photo})
+        cell.add('img', attrib={**_CELL_PHOTO_ATTR, 'src': self._photo})
     if self.day:
-        cell.add('div', text=str(self._day),
-                 attrib={'class': 'cell-text-day'})
+        cell.add('div', text=str(self._day), attrib=_CELL_DAY_ATTR)
     if self.text:
-        cell.add('div', text=str(self._text),
-                 attrib={'class': 'cell-text-overlay'})
+        cell.add('div', text=str(self._text), attrib=_CELL_TEXT_ATTR)
     if self.moon_phase:
         cell.append(HtmlEncoder.to_html(self.moon_phase))
     return cell
@@ -99,24 +110,13 @@ def MonthHtml(self: _libcal.Month) -> ET.Element:
     The element contains the month header, weekday headings and a grid of
     day cells sized for printing on a letter landscape page.
     """
-    page = _libhtml.HtmlTag('div', attrib={'class': 'page-letter-landscape'})
-    cal = page.add('div', attrib={'class': 'month'})
-
-    cal.add('div', text=f"{self.name} {self.year}".upper(),
-            attrib={'class': 'month-header'})
-
-    header = cal.add('div', attrib={'class': 'container'})
-    _days, _cells = self.table
-    for day in _days:
-        header.add('div', text=day, attrib={'class': 'month-day-header'})
-
-    grid = cal.add(
-        'div', attrib={'class': 'container', 'style': 'border: 1px solid black;'})
-    for row in _cells:
-        for c in row:
-            grid.append(HtmlEncoder.to_html(c))
-
-    cal.add("div", attrib={'class': 'page-break'})
+    page, cal = _common.month_element(
+        self, HtmlEncoder,
+        page_attr=_PAGE_ATTR, month_attr=_MONTH_ATTR,
+        header_text=self.display_title, header_attr=_MONTH_HEADER_ATTR,
+        weekdays=self.table[0], weekday_row_attr=_CONTAINER_ATTR,
+        day_header_attr=_DAY_HEADER_ATTR, grid_attr=_GRID_ATTR)
+    cal.add("div", attrib=_PAGE_BREAK_ATTR)
     return page
 
 
@@ -129,45 +129,65 @@ def CalendarHtml(self: _libcal.Calendar) -> ET.Element:
     full HTML document produced by WallCalendar.__html__.
     """
     cal = _libhtml.HtmlTag('div', attrib={'class': 'calendar'})
-    cal.append(HtmlEncoder.to_html(self.front_page))
-    for mi in self.pages:
-        cal.append(HtmlEncoder.to_html(mi.art))
-        cal.append(HtmlEncoder.to_html(mi.month))
+    cal.extend(_calendar_pages(self))
     return cal
 
 
+def _calendar_pages(calendar: _libcal.Calendar) -> Iterator[ET.Element]:
+    """Yield the front page, then the art and month page for each month."""
+    to_html = HtmlEncoder.to_html
+    yield to_html(calendar.front_page)
+    for mi in calendar.pages:
+        yield to_html(mi.art)
+        yield to_html(mi.month)
+
+
 class WallCalendar:
     """Generate a complete HTML document for a wall calendar instance.
 
     The object wraps a lib.pycal.Calendar and exposes __html__ returning
-    an ElementTree for writing to disk. CSS file locations are provided
+    an ElementTree, or write() to stream the document to a file. CSS file locations are provided
     by CssResources.
     """
     def __init__(self, calendar: _libcal.Calendar):
         self._calendar = calendar
 
-    def __html__(self) -> ET.ElementTree:
-        root = _libhtml.HtmlTag("html")
-        head = root.add("head")
+    def _head(self) -> ET.Element:
+        head = _libhtml.HtmlTag("head")
         head.add('title', text='Calendar')
         head.add('link', attrib={'rel': "stylesheet",
                  'href': CssResources.CALENDAR_CSS})
         head.add('link', attrib={
             'rel': "stylesheet", 'type': 'text/css', 'media': 'print', 'href': CssResources.PRINT_CSS})
+        return head
+
+    def __html__(self) -> ET.ElementTree:
+        root = _libhtml.HtmlTag("html")
+        root.append(self._head())
 
         body = root.add('body', attrib={'class': 'main'})
 
         body.append(HtmlEncoder.to_html(self._calendar))
         return ET.ElementTree(root)
 
+    def write(self, fp: TextIO) -> None:
+        """Stream the document to `fp` one page at a time.
+
+        Produces the same markup as serializing __html__(), but only one
+        page fragment is built and held in memory at any point.
+        """
+        writer = _libhtml.HtmlWriter(fp)
+        writer.write("<html>")
+        writer.element(self._head())
+        writer.write('<body class="main"><div class="calendar">')
+        for page in _calendar_pages(self._calendar):
+            writer.element(page)
+        writer.write("</div></body></html>")
+
 
 if __name__ == "__main__":
     import lib.calendar.ics_loader as _libics
     import sys
     cal = _libcal.Calendar(year=2025, events=_libcal.EventsManager(
         2025, birthdays=_libics.TestVCalendar()))
-    cal = WallCalendar(cal)
-    root = HtmlEncoder.to_html(cal)
-
-    root.write(sys.stdout, encoding='unicode',
-               method='html')
+    WallCalendar(cal).write(sys.stdout)
@@ -6,7 +6,13 @@ for the calendar model objects from lib.pycal so the calendar can be
 rendered to PIL images for preview or saving.
 """
 
+import collections
+import concurrent.futures
+import functools
+import itertools
+
 import PIL.Image
+import PIL.ImageDraw
 
 try:
     import lib as __lib
@@ -16,7 +22,7 @@ except:
     sys.path.append(dirname(dirname(dirname(__file__))))
 
 import lib.pycal as _libcal
-from typing import List
+from typing import Dict, List, Tuple
 
 import lib.print.draw as _libdraw
 
@@ -47,6 +53,33 @@ class DeskCalSize:
     CAL_WIDTH = 2.6
     CAL_HEIGHT = 2.6
 
+    # dpi -> {'info' | 'image' | 'cal': (x, y, w, h) in pixels}
+    _pixel_cache: Dict[int, Dict[str, Tuple[int, int, int, int]]] = {}
+
+    @staticmethod
+    def pixel_boxes() -> Dict[str, Tuple[int, int, int, int]]:
+        """Return the layout boxes as (x, y, w, h) pixels at the current DPI.
+
+        Computed once per DPI so paste call sites need no unit conversion.
+        The 'cal' size is CAL_WIDTH x CAL_HEIGHT, the size month grids are
+        rendered at.
+        """
+        dpi = _libdraw.Resolution.dpi
+        boxes = DeskCalSize._pixel_cache.get(dpi)
+        if boxes is None:
+            to_pt = _libdraw.Resolution.to_pt
+            info = DeskCalSize.info_bbox()
+            image = DeskCalSize.image_bbox()
+            cal = DeskCalSize.cal_bbox()
+            boxes = {
+                'info': to_pt((info.x, info.y, info.width, info.height)),
+                'image': to_pt((image.x, image.y, image.width, image.height)),
+                'cal': to_pt((cal.x, cal.y,
+                              DeskCalSize.CAL_WIDTH, DeskCalSize.CAL_HEIGHT)),
+            }
+            DeskCalSize._pixel_cache[dpi] = boxes
+        return boxes
+
     @staticmethod
     def info_bbox() -> _libdraw.BBox:
         return _libdraw.BBox.new(DeskCalSize.IMAGE_WIDTH, DeskCalSize.TOP_PADDING, DeskCalSize.INFO_WIDTH, DeskCalSize.INFO_HEIGHT)
@@ -78,6 +111,22 @@ class DeskCalSize:
 ImageDrawer = _libdraw.DrawDecoder()
 
 
+@functools.lru_cache(maxsize=32)
+def _font(face: _libdraw.Fonts._Font, size: int, dpi: int) -> _libdraw.Font:
+    """Return a shared Font for `face` at `size` points and `dpi`.
+
+    Font converts the point size with the DPI current at construction, so
+    the DPI is part of the key; the TTF is parsed once per combination.
+    """
+    return _libdraw.Font(face, size)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve(files: FilesManager, filename: str):
+    """Memoized FilesManager.get_file_path, keyed on the active manager."""
+    return files.get_file_path(filename)
+
+
 class DeskCalendarPage:
     """Container for a single desk calendar page image.
 
@@ -94,7 +143,13 @@ class DeskCalendarPage:
             self._page = _libdraw.Image.new(
                 size=(self._width, self._height), color="white")
         else:
+            # Wrap the caller's image as-is: pages are composited in place,
+            # so refuse anything that would need a converting copy.
+            mode = page.image.mode if isinstance(page, _libdraw.Image) else page.mode
+            if mode != 'RGB':
+                raise ValueError(f"desk page must be an RGB image, got {mode}")
             self._page = page
+        self._draw = None
 
     @property
     def width(self) -> float:
@@ -108,6 +163,18 @@ class DeskCalendarPage:
     def page(self) -> _libdraw.Image:
         return self._page
 
+    def _page_image(self) -> PIL.Image.Image:
+        if isinstance(self._page, _libdraw.Image):
+            return self._page.image
+        return self._page
+
+    @property
+    def draw(self) -> _libdraw.Draw:
+        """Drawing context for the page, created once and reused."""
+        if self._draw is None:
+            self._draw = _libdraw.Draw(self._page)
+        return self._draw
+
     def set_image(self, image: str) -> None:
         """Paste the provided image into the page's image area.
 
@@ -119,11 +186,16 @@ class DeskCalendarPage:
         img_w = pos.width
         img_h = pos.height
 
+        x, y, w, h = DeskCalSize.pixel_boxes()['image']
+
         img = _libdraw.Image(str(image))
+        # Keep 2x headroom so the final Lanczos pass still has detail to
+        # work with after the decoder's DCT downscale.
+        img.draft_hint((img_w * 2, img_h * 2))
 
-        img.resize((img_w, img_h))
-        draw = _libdraw.Draw(self._page)
-        draw.paste(img, (pos.x, pos.y))
+        if img.image.size != (w, h):
+            img.resize((img_w, img_h))
+        self._page_image().paste(img.image, (x, y))
 
     def set_calendar(self, image: PIL.Image.Image) -> None:
         """Paste a small calendar image into the info area of the page.
@@ -136,13 +208,26 @@ class DeskCalendarPage:
         img_w = DeskCalSize.CAL_WIDTH
         img_h = DeskCalSize.CAL_HEIGHT
 
+        x, y, w, h = DeskCalSize.pixel_boxes()['cal']
+
         img = _libdraw.Image(image)
-        img.resize((img_w, img_h))
+        # DrawMonth already renders at the bbox size; only resize foreign
+        # images.
+        if img.image.size != (w, h):
+            img.resize((img_w, img_h))
 
-        draw = _libdraw.Draw(self._page)
-        pos = DeskCalSize.cal_bbox()
+        self._page_image().paste(img.image, (x, y))
 
-        draw.paste(img, (pos.x, pos.y))
+    def set_calendar_inplace(self, image: PIL.Image.Image) -> None:
+        """Paste a month grid already rendered at the calendar bbox size.
+
+        Pastes straight onto the page image without the Image/Draw
+        wrappers; images of any other size go through set_calendar.
+        """
+        x, y, w, h = DeskCalSize.pixel_boxes()['cal']
+        if image.size != (w, h):
+            return self.set_calendar(image)
+        self._page_image().paste(image, (x, y))
 
 
 @ImageDrawer.override(_libcal.FrontPage)
@@ -153,20 +238,19 @@ def DrawFrontPage(self: _libcal.FrontPage) -> PIL.Image:
     text in the info area on the right. Returns a PIL.Image instance ready
     for saving or preview.
     """
-    if True:
-        page = DeskCalendarPage()
-        if self.image:
-            image_path = FilesManager.instance().get_file_path(self.image)
-            page.set_image(image_path)
-        draw = _libdraw.Draw(page.page)
+    page = DeskCalendarPage()
+    if self.image:
+        image_path = _resolve(FilesManager.instance(), self.image)
+        page.set_image(image_path)
+    draw = page.draw
 
-        center = DeskCalSize.info_bbox().center
-        font = _libdraw.Font(_libdraw.fonts.EBGaramond_Bold, 48)
-        draw.text(self.title, center, font, anchor='mm',
-                  fill='black', align='center')
+    center = DeskCalSize.info_bbox().center
+    font = _font(_libdraw.fonts.EBGaramond_Bold, 48, _libdraw.Resolution.dpi)
+    draw.text(self.title, center, font, anchor='mm',
+              fill='black', align='center')
 
-        # page.page.image.show()
-        return page.page.image
+    # page.page.image.show()
+    return page.page.image
 
 
 @ImageDrawer.override(_libcal.CalendarArt)
@@ -176,97 +260,149 @@ def DrawArtPage(self: _libcal.CalendarArt) -> PIL.Image.Image:
     The artwork fills the left side image area while a small title is drawn
     on the right info area. Returns a PIL.Image instance.
     """
-    if True:
-        page = DeskCalendarPage()
-        if self.image:
-            image_path = FilesManager.instance().get_file_path(self.image)
-            page.set_image(image_path)
-        """
-        info:
-            width: 3
-            height: 4
-
-            padding: .25
-            __________________________
-            |   ______2.6_________   | 
-            |.2|                  |  |
-            |  |    Title         |  |
-            |  |      Mar 2       |  |
-            |  |__________________|  |
-            _.2______________________|
-        """
-        draw = _libdraw.Draw(page.page)
+    page = DeskCalendarPage()
+    if self.image:
+        image_path = _resolve(FilesManager.instance(), self.image)
+        page.set_image(image_path)
+    """
+    info:
+        width: 3
+        height: 4
+
+        padding: .25
+        __________________________
+        |   ______2.6_________   | 
+        |.2|                  |  |
+        |  |    Title         |  |
+        |  |      Mar 2       |  |
+        |  |__________________|  |
+        _.2______________________|
+    """
+    draw = page.draw
+
+    title_width = 2.6
+    title_height = .5
+    padding = .2
+
+    right = page.width - padding
+    bot = page.height - padding
+    left = right - title_width
+    top = bot - title_height
+    bbox = _libdraw.BBox(left, top, right, bot)
+    text_pos = bbox.center
+    font = _font(_libdraw.fonts.EBGaramond, 14, _libdraw.Resolution.dpi)
+    draw.text(self.title, text_pos, font, anchor='mm',
+              fill='black', align='center')
+    # draw.rectangle(bbox, fill=None, outline='red', width="1pt")
+    return page.page.image
+
+
+@functools.lru_cache(maxsize=8)
+def _month_template(dpi: int, headers: Tuple[str, ...]) -> PIL.Image.Image:
+    """Return a blank month grid with the weekday headings already drawn.
+
+    The headings are identical for every month, so they are rasterized
+    once per DPI and copied for each month instead of redrawn.
+    """
+    _, _, w, h = DeskCalSize.pixel_boxes()['cal']
 
-        title_width = 2.6
-        title_height = .5
-        padding = .2
+    img = _libdraw.Image(PIL.Image.new('RGB', (w, h), color='white'))
+    draw = _libdraw.Draw(img)
 
-        right = page.width - padding
-        bot = page.height - padding
-        left = right - title_width
-        top = bot - title_height
-        bbox = _libdraw.BBox(left, top, right, bot)
-        text_pos = bbox.center
-        font = _libdraw.Font(_libdraw.fonts.EBGaramond, 14)
-        draw.text(self.title, text_pos, font, anchor='mm',
-                  fill='black', align='center')
-        # draw.rectangle(bbox, fill=None, outline='red', width="1pt")
-        return page.page.image
+    font = _font(_libdraw.fonts.Roboto_Bold, 10, dpi)
 
+    # Calendar Week days
+    # Height .2
+    # Width .37
+    # 7 cells = .37*7 = 2.59
+    pos = _libdraw.BBox(0, .6, .37, .8)
+    for c in headers:
+        # draw.rectangle(pos, outline='red', width='1pt')
+        draw.text(c[:3], pos.center, font, fill='black',
+                  anchor='mm', align='center')
+        pos = pos.move(0.37, 0)
+    return img.image
 
-@ImageDrawer.override(_libcal.Month)
-def DrawMonth(self: _libcal.Month):
-    """Render the month grid into an image sized for the desk layout.
 
-    A new image is created for the month grid, the month name and weekday
-    headings are drawn, then each day number is placed into the grid
-    according to the Month.table provided by lib.pycal.
-    """
-    # 2.6x2.6
-    pos = DeskCalSize.cal_bbox()
+@functools.lru_cache(maxsize=256)
+def _text_sprite(font: _libdraw.Font, text: str) -> Tuple[PIL.Image.Image, Tuple[int, int]]:
+    """Rasterize `text` once as an 'L' mask centered on the origin.
 
-    img = _libdraw.Image.new((pos.width, pos.height), color='white')
+    Returns (mask, (left, top)); pasting a fill through the mask at the
+    anchor point plus (left, top) reproduces draw.text(..., anchor='mm').
+    """
+    left, top, right, bottom = font.font.getbbox(text, anchor='mm')
+    mask = PIL.Image.new('L', (right - left, bottom - top), 0)
+    PIL.ImageDraw.Draw(mask).text((-left, -top), text, fill=255,
+                                  font=font.font, anchor='mm')
+    return mask, (left, top)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_month(dpi: int, title: str, headers: Tuple[str, ...],
+                  weeks: Tuple[Tuple[int, ...], ...]) -> PIL.Image.Image:
+    """Rasterize a month grid; cached on everything that affects pixels."""
+    img = _libdraw.Image(_month_template(dpi, headers).copy())
     draw = _libdraw.Draw(img)
 
     # Calendar title
     # Width 2.6
     # Height .6
-    title = _libdraw.BBox((0, 0, 2.6, .6))
+    title_box = _libdraw.BBox((0, 0, 2.6, .6))
 
-    font = _libdraw.Font(_libdraw.fonts.Roboto_Bold, 24)
-    draw.text(f"{self.name} {self.year}", title.center, font,
+    font = _font(_libdraw.fonts.Roboto_Bold, 24, dpi)
+    draw.text(title, title_box.center, font,
               fill='black', anchor='mm', align='center')
 
-    font = _libdraw.Font(_libdraw.fonts.Roboto_Bold, 10)
+    font = _font(_libdraw.fonts.Roboto, 10, dpi)
+
+    # Day numbers repeat across months: paste cached glyph masks rather
+    # than shaping the same strings again.
+    page = img.image
+    for week, centers in zip(weeks, _cell_centers(dpi)):
+        for day, (x, y) in zip(week, centers):
+            if day:
+                mask, (left, top) = _text_sprite(font, str(day))
+                page.paste('black', (x + left, y + top), mask)
+    return page
 
-    # Calendar Week days
-    # Height .2
-    # Width .37
-    # 7 cells = .37*7 = 2.59
-    header = _libdraw.BBox(0, .6, .37, .8)
-    headers, weeks = self.table
-    pos = header
-    for c in headers:
-        # draw.rectangle(pos, outline='red', width='1pt')
-        draw.text(c[:3], pos.center, font, fill='black',
-                  anchor='mm', align='center')
-        pos = pos.move(0.37, 0)
 
+@functools.lru_cache(maxsize=8)
+def _cell_centers(dpi: int) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    """Pixel centers of the 6x7 day cells of a month grid at `dpi`."""
     # Calendar Days
     # Day Height .3
     # Day Width .37
-    font = _libdraw.Font(_libdraw.fonts.Roboto, 10)
+    rows = []
     day_start = _libdraw.BBox(0, .8, .37, .8+.3)
-
-    for week in weeks:
+    for _ in range(6):
         day_pos = day_start
-        for day in week:
-            if day.day:
-                draw.text(str(day.day), day_pos.center, font,
-                          fill='black', anchor='mm', align='center')
+        row = []
+        for _ in range(7):
+            row.append(_libdraw.Resolution.to_pt(day_pos.center))
             day_pos = day_pos.move(.37, 0)
+        rows.append(tuple(row))
         day_start = day_start.move(0, .3)
-    return img.image
+    return tuple(rows)
+
+
+@ImageDrawer.override(_libcal.Month)
+def DrawMonth(self: _libcal.Month):
+    """Render the month grid into an image sized for the desk layout.
+
+    The month name and weekday headings are drawn, then each day number is
+    placed into the grid according to the Month.table provided by
+    lib.pycal. Rendered grids are cached, so a copy is returned.
+    """
+    headers, weeks = self.table
+    img = _render_month(_libdraw.Resolution.dpi, f"{self.name} {self.year}",
+                        tuple(headers),
+                        tuple(tuple(day.day for day in week) for week in weeks))
+    return img.copy()
+
+
+# Month pages rendered ahead of the consumer by DrawCalendar
+_PAGES_AHEAD = 2
 
 
 @ImageDrawer.override(_libcal.Calendar)
@@ -277,23 +413,44 @@ def DrawCalendar(self: _libcal.Calendar):
     as a DeskCalendarPage instance with the month grid pasted into the
     artwork background.
     """
-    images = []
-    yield from ImageDrawer.draw(self.front_page)
-    for page in self.pages:
-        img = next(ImageDrawer.draw(page.art))
-        cal = next(ImageDrawer.draw(page.month))
-        calpage = DeskCalendarPage(img)
-        calpage.set_calendar(cal)
-        yield calpage.page
+    # Month pages are independent and Pillow does most of the work in C,
+    # so render them on a pool while the cover is drawn. Only
+    # _PAGES_AHEAD pages are in flight at once: a finished page waits in
+    # memory until the caller takes it, and at high DPI each page is large.
+    #
+    # Workers share the cached fonts. That is safe because PIL's
+    # _imagingft never releases the GIL, so FreeType calls on a shared
+    # face are serialized.
+    pages = iter(self.pages)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_PAGES_AHEAD) as ex:
+        pending = collections.deque(
+            ex.submit(_render_month_page, page)
+            for page in itertools.islice(pages, _PAGES_AHEAD))
+        try:
+            yield from ImageDrawer.draw(self.front_page)
+            while pending:
+                image = pending.popleft().result()
+                for page in itertools.islice(pages, 1):
+                    pending.append(ex.submit(_render_month_page, page))
+                yield image
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _render_month_page(page: _libcal.Calendar.MonthInfo) -> _libdraw.Image:
+    """Compose one month page: artwork with the month grid pasted on."""
+    img = next(ImageDrawer.draw(page.art))
+    cal = next(ImageDrawer.draw(page.month))
+    calpage = DeskCalendarPage(img)
+    calpage.set_calendar_inplace(cal)
+    return calpage.page
 
 
 def expan_to_legal(image:PIL.Image.Image) -> PIL.Image.Image:
     """
     Takes a desk_callendar image (4.25x7), and tile out to a Legal(8.5x14) size
     """
-    import PIL.ImageDraw
-    import PIL.ImageOps
-
     if image is None:
         raise ValueError("image must be a PIL.Image.Image")
 
@@ -338,34 +495,40 @@ def expan_to_legal(image:PIL.Image.Image) -> PIL.Image.Image:
     canvas.paste(img, positions[0])
     canvas.paste(img, positions[1])
 
-    rotated_180 = img.rotate(180)
+    rotated_180 = img.transpose(PIL.Image.Transpose.ROTATE_180)
     canvas.paste(rotated_180, positions[2])
     canvas.paste(rotated_180, positions[3])
 
     # Draw dashed cut lines at center between tiles
-    draw = PIL.ImageDraw.Draw(canvas)
     center_x = tile_w
     center_y = tile_h
 
     dash_len = max(6, int(round(ppi * 0.03)))
     gap_len = dash_len
 
-    # Vertical dashed line
-    y = 0
-    while y < out_h:
-        y2 = min(y + dash_len, out_h)
-        draw.line([(center_x, y), (center_x, y2)], fill="black", width=1)
-        y += dash_len + gap_len
-
-    # Horizontal dashed line
-    x = 0
-    while x < out_w:
-        x2 = min(x + dash_len, out_w)
-        draw.line([(x, center_y), (x2, center_y)], fill="black", width=1)
-        x += dash_len + gap_len
+    # Dashed cut lines: paste black through a one-pixel-wide dash mask
+    # instead of one draw.line call per dash.
+    canvas.paste("black", (center_x, 0),
+                 _dash_mask((1, out_h), dash_len, gap_len))
+    canvas.paste("black", (0, center_y),
+                 _dash_mask((out_w, 1), dash_len, gap_len))
 
     return canvas
 
+
+def _dash_mask(size: Tuple[int, int], dash_len: int, gap_len: int) -> PIL.Image.Image:
+    """Return an 'L' mask for a one-pixel-wide dashed line of `size`.
+
+    Matches the previous per-dash draw.line output: a line includes both
+    end points, so each dash covers dash_len + 1 pixels and the gap one
+    fewer than gap_len.
+    """
+    length = max(size)
+    pattern = b"\xff" * (dash_len + 1) + b"\x00" * (gap_len - 1)
+    data = (pattern * (length // len(pattern) + 1))[:length]
+    return PIL.Image.frombytes("L", size, data)
+
+
 if __name__ == "__main__":
     fm = FilesManager("resources")
     # test_image = "images/PXL_COVER.jpg"
@@ -385,5 +548,7 @@ if __name__ == "__main__":
     cal = _libcal.Calendar(2025)
     imgs = ImageDrawer.draw(cal)
     for i, img in enumerate(imgs):
+        if isinstance(img, _libdraw.Image):
+            img = img.image
         fout = fm.get_file_path(f"out/page_{i}.png")
         img.save(str(fout))
@@ -7,6 +7,7 @@ DrawDecoder which is used by higher-level print modules to register
 rendering functions for application objects.
 """
 
+import operator
 import os
 import re
 
@@ -14,6 +15,7 @@ import PIL.FontFile
 import PIL.Image
 import PIL.ImageDraw
 import PIL.ImageFont
+import PIL.ImageOps
 from typing import Iterable, List, Tuple, Union, Any
 import lib.print.fonts as fonts
 from lib.print.fonts import Fonts
@@ -21,6 +23,20 @@ from lib.print.decoder_base import DecoderBase
 
 PRINT_DPI = 300
 
+# A number with an optional lowercase unit suffix, e.g. '12.5in' or '4pt'.
+_FMT_EXP = re.compile(r"([-+]?[0-9]*\.?[0-9]+)([a-z]*)\Z")
+
+
+def _split_length(value: str) -> Tuple[float, str]:
+    """Split '12.5in' into (12.5, 'in'), ignoring case and outer blanks.
+
+    Raises ValueError when `value` is not a number with an optional unit.
+    """
+    m = _FMT_EXP.match(value.strip().lower())
+    if m is None:
+        raise ValueError(f"Invalid length: {value!r}")
+    return float(m.group(1)), m.group(2)
+
 
 class Units:
     IN = "in"
@@ -38,13 +54,24 @@ class _Resolution:
     are consistent across the drawing code.
     """
     NUMBER = r"[-+]?[0-9]*\.?[0-9]+"
-    FMT_EXP = re.compile(f"({NUMBER})([a-z]*)")
+    FMT_EXP = _FMT_EXP
 
     def __init__(self):
         self._dpi = PRINT_DPI
         self._unit = Units.NONE
         self._default = self.none_to_pt
         self._revert = self.none_to_pt
+        # Unit suffix -> bound converter; "" is a bare number in the
+        # default unit. Other suffixes fall back to getattr lookup.
+        self._to_pt_fns = {
+            "in": self.in_to_pt, "mm": self.mm_to_pt, "cm": self.cm_to_pt,
+            "px": self.px_to_pt, "pt": self.pt_to_pt,
+            "none": self.none_to_pt, "": self._default,
+        }
+        self._pt_to_fns = {"in": self.pt_to_in, "": self._revert}
+        # Parsed to_pt() strings ('4pt', '12.5in'); reset when the DPI or
+        # default unit changes.
+        self._parsed = {}
 
     @property
     def dpi(self) -> int:
@@ -69,11 +96,15 @@ class _Resolution:
             self._default = fn
             self._revert = fn2
             self._unit = unit
+            self._to_pt_fns[""] = fn
+            self._pt_to_fns[""] = fn2
+            self._parsed.clear()
 
     @dpi.setter
     def dpi(self, value) -> None:
         """Set the DPI value used for unit conversions."""
         self._dpi = int(value)
+        self._parsed.clear()
 
     def none_to_pt(self, val: float) -> int:
         """Identity conversion when no unit is set."""
@@ -131,16 +162,29 @@ class _Resolution:
         if isinstance(value, (float, int)):
             return self._to_pt(value)
         elif isinstance(value, (tuple, list)):
-            val = []
-            for v in value:
-                val.append(self.to_pt(v))
-            t = type(value)
-            return t(val)
-        m = Resolution.FMT_EXP.match(value)
-        if m:
-            fn = getattr(self, f"{m.group(2)}_to_pt")
-            return fn(float(m.group(1)))
-        return 0
+            # Convert numbers and strings inline; only nested sequences
+            # recurse through to_pt.
+            default = self._default
+            parsed = self._parsed
+            val = [None] * len(value)
+            for i, v in enumerate(value):
+                tv = type(v)
+                if tv is float or tv is int:
+                    val[i] = default(v)
+                elif tv is str and v in parsed:
+                    val[i] = parsed[v]
+                else:
+                    val[i] = self.to_pt(v)
+            return type(value)(val)
+        pt = self._parsed.get(value)
+        if pt is None:
+            pt = self._parsed[value] = self._parse_to_pt(value)
+        return pt
+
+    def _parse_to_pt(self, value: str) -> int:
+        number, unit = _split_length(value)
+        fn = self._to_pt_fns.get(unit) or getattr(self, f"{unit}_to_pt")
+        return fn(number)
 
     def pt_to(self, *value: str) -> int:
         """Convert points back to the configured unit or to a numeric value.
@@ -153,16 +197,18 @@ class _Resolution:
         if isinstance(value, (float, int)):
             return self._pt_to(value)
         elif isinstance(value, (tuple, list)):
-            val = []
-            for v in value:
-                val.append(self.pt_to(v))
-            t = type(value)
-            return t(val)
-        m = Resolution.FMT_EXP.match(value)
-        if m:
-            fn = getattr(self, f"pt_to_{m.group(2)}")
-            return fn(float(m.group(1)))
-        return 0
+            revert = self._revert
+            val = [None] * len(value)
+            for i, v in enumerate(value):
+                tv = type(v)
+                if tv is float or tv is int:
+                    val[i] = revert(v)
+                else:
+                    val[i] = self.pt_to(v)
+            return type(value)(val)
+        number, unit = _split_length(value)
+        fn = self._pt_to_fns.get(unit) or getattr(self, f"pt_to_{unit}")
+        return fn(number)
 
 Resolution = _Resolution()
 
@@ -174,6 +220,10 @@ class BBox(tuple):
     properties for width/height/center and simple geometry helpers move()
     and shrink().
     """
+    # No per-instance __dict__; fields are read with C-level itemgetters
+    # the way collections.namedtuple does.
+    __slots__ = ()
+
     @staticmethod
     def new(x, y, w, h) -> 'BBox':
         return BBox(x, y, x + w, y + h)
@@ -184,29 +234,11 @@ class BBox(tuple):
         if len(args) != 4:
             raise TypeError(f"Failed to create bbox from {args}")
         return tuple.__new__(BBox, args)
-    @property
-    def left(self) -> int:
-        return self[0]
-
-    @property
-    def top(self) -> int:
-        return self[1]
 
-    @property
-    def right(self) -> int:
-        return self[2]
-
-    @property
-    def bottom(self) -> int:
-        return self[3]
-
-    @property
-    def x(self) -> int:
-        return self[0]
-
-    @property
-    def y(self) -> int:
-        return self[1]
+    left = x = property(operator.itemgetter(0))
+    top = y = property(operator.itemgetter(1))
+    right = property(operator.itemgetter(2))
+    bottom = property(operator.itemgetter(3))
 
     @property
     def width(self) -> int:
@@ -218,19 +250,8 @@ class BBox(tuple):
 
     @property
     def center(self):
-        if len(self) == 4:
-            left = self[0]
-            top = self[1]
-            right = self[2]
-            bot = self[3]
-
-            w = right - left
-            h = bot - top
-
-            x = left + w/2
-            y = top + h/2
-            return (x, y)
-        return self
+        left, top, right, bot = self
+        return (left + (right - left)/2, top + (bot - top)/2)
 
     def move(self, *pos) -> "BBox":
         if len(pos) == 1:
@@ -279,7 +300,7 @@ class Font:
         return img
 
     def Draw(self,
-             target: PIL.Image.Image,
+             target: Union[PIL.Image.Image, 'Draw'],
              text: str, xy,
              fill=None,
              anchor=None,
@@ -291,7 +312,15 @@ class Font:
              stroke_width=0,
              stroke_fill=None,
              embedded_color=False) -> None:
-        draw = PIL.ImageDraw.Draw(target)
+        """Draw `text` at pixel position `xy` on `target`.
+
+        `target` may be a PIL image or a Draw; passing the page's Draw
+        reuses its ImageDraw instead of building one per call.
+        """
+        if isinstance(target, Draw):
+            draw = target._draw
+        else:
+            draw = PIL.ImageDraw.Draw(target)
         draw.text(xy, text, fill, self._font, anchor, spacing, align, direction,
                   features, language, stroke_width, stroke_fill, embedded_color)
 
@@ -300,66 +329,46 @@ def _resize_to_cover(image: PIL.Image.Image, bbox: Tuple):
     if len(bbox) == 2:
         bbox = (0, 0, bbox[0], bbox[1])
     # Bounding box: (left, upper, right, lower)
-        left, upper, right, lower = bbox
+    left, upper, right, lower = bbox
     bbox_width = right - left
     bbox_height = lower - upper
 
     # Get the image size
     img_width, img_height = image.size
 
-    # Calculate aspect ratios
-    img_aspect_ratio = img_width / img_height
-    bbox_aspect_ratio = bbox_width / bbox_height
-
-    # Resize image to cover the bbox area (like object-fit: cover in CSS)
-    if img_aspect_ratio > bbox_aspect_ratio:
+    # Resize image to cover the bbox area (like object-fit: cover in CSS).
+    # Compare aspect ratios by cross-multiplying so the sizes stay exact
+    # integers.
+    if img_width * bbox_height > bbox_width * img_height:
         # Image is wider than the bounding box
         new_height = bbox_height
-        new_width = int(new_height * img_aspect_ratio)
+        new_width = img_width * bbox_height // img_height
     else:
         # Image is taller than the bounding box
         new_width = bbox_width
-        new_height = int(new_width / img_aspect_ratio)
-
-    # Resize the image
-    resized_image = image.resize(
-        (new_width, new_height), PIL.Image.Resampling.LANCZOS)
+        new_height = img_height * bbox_width // img_width
 
     # Calculate the position to crop the image to fit inside the bbox
     left_offset = (new_width - bbox_width) // 2
     top_offset = (new_height - bbox_height) // 2
 
-    # Crop the image to fit the bounding box
-    cropped_image = resized_image.crop(
-        (left_offset, top_offset, left_offset + bbox_width, top_offset + bbox_height))
-
-    return cropped_image
+    # Resample only the source region that survives the crop, straight to
+    # the bbox size, instead of resizing everything and cropping a copy.
+    scale_x = img_width / new_width
+    scale_y = img_height / new_height
+    box = (left_offset * scale_x, top_offset * scale_y,
+           (left_offset + bbox_width) * scale_x,
+           (top_offset + bbox_height) * scale_y)
+    return image.resize((bbox_width, bbox_height),
+                        PIL.Image.Resampling.LANCZOS, box=box)
 
 
 def _resize_cover(image: PIL.Image.Image, size: tuple) -> PIL.Image.Image:
     """Resize an image to cover the target size, maintaining aspect ratio."""
-    width, height = image.size
-    orig_ratio = width / height
-
-    target_width, target_height = size
-
-    # Determine which dimension to scale
-    if orig_ratio > 1:
-        new_width = target_width
-        new_height = int(target_width/orig_ratio)
-    else:
-        new_height = target_height
-        new_width = int(target_height * orig_ratio)
-
-    # Resize and crop
-    resized_image = image.resize(
-        (new_width, new_height), PIL.Image.Resampling.LANCZOS)
-    x_offset = (new_width - target_width) // 2
-    y_offset = (new_height - target_height) // 2
-    cropped_image = resized_image.crop(
-        (x_offset, y_offset, x_offset + target_width, y_offset + target_height))
-
-    return cropped_image
+    # ImageOps.fit resamples just the centered source region straight to
+    # `size` in one pass, with no oversized intermediate to crop.
+    return PIL.ImageOps.fit(image, tuple(size), PIL.Image.Resampling.LANCZOS,
+                            centering=(0.5, 0.5))
 
 
 class Image:
@@ -384,6 +393,15 @@ class Image:
     def convert(self, mode) -> None:
         self._image = self._image.convert(mode=mode)
 
+    def draft_hint(self, size: Tuple, mode="RGB") -> None:
+        """Ask the decoder for a reduced image no smaller than `size`.
+
+        JPEG files are then scaled by 1/2, 1/4 or 1/8 during decoding,
+        which is much cheaper than decoding at full size and resizing.
+        Other formats ignore the hint. Call before touching the pixels.
+        """
+        self._image.draft(mode, Resolution.to_pt(size))
+
     def resize(self, size: Tuple) -> None:
         size = Resolution.to_pt(size)
         self._image = _resize_to_cover(self._image, size)
@@ -567,20 +585,40 @@ class Draw:
         return BBox(bbox)
 
     def get_multiline_text(self, text : str, width : int, font) -> str:
-        tokens = text.split(" ")
+        """Word-wrap `text` so each line fits within `width` units.
+
+        Each word is measured once and line widths are kept as a running
+        sum of advances, instead of re-measuring the whole line per word.
+        Existing line breaks are kept and each paragraph wraps on its own.
+        """
+        if "\n" in text:
+            return "\n".join(self.get_multiline_text(part, width, font)
+                             for part in text.split("\n"))
+        if isinstance(font, Font):
+            font = font.font
+        getlength = font.getlength
+        space_w = getlength(" ")
 
         lines = []
-        current = ""
-        for token in tokens:
-            candidate = f"{current} {token}" if current else token
-            bbox = self.textbbox(candidate, (0, 0), font)
-            if bbox.width > width and current:
-                lines.append(current)
-                current = token
+        current = []
+        current_w = 0.0
+        for token in text.split(" "):
+            token_w = getlength(token)
+            if not current:
+                if token:
+                    current = [token]
+                    current_w = token_w
+                continue
+            candidate_w = current_w + space_w + token_w
+            if Resolution.pt_to(candidate_w) > width:
+                lines.append(" ".join(current))
+                current = [token]
+                current_w = token_w
             else:
-                current = candidate
+                current.append(token)
+                current_w = candidate_w
         if current:
-            lines.append(current)
+            lines.append(" ".join(current))
         return "\n".join(lines)
 
 class DrawDecoder(DecoderBase):
@@ -6,6 +6,7 @@ with an _Font factory, an open() helper that tries repository and resource
 font locations, and a MAP of common font name mappings.
 """
 
+import functools
 import os
 import PIL.ImageFont
 from typing import Iterable
@@ -39,7 +40,10 @@ class Fonts:
     """
 
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def open(fontname, size=10) -> PIL.ImageFont.FreeTypeFont:
+        # Cached per (fontname, size): the file is read and the FreeType
+        # face opened once, and the returned font is shared by callers.
         # Try known font directories first
         path = _find_font_path(fontname)
         if path:
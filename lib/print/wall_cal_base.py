@@ -158,17 +158,16 @@ class MoonPhaseImages:
     FULL_MOON_PATH = os.path.join(MOON_PHASES, "full-moon.png")
     THIRD_QUARTER_PATH = os.path.join(MOON_PHASES, "third-quarter.png")
 
+    _PHASE_MAP = {
+        _MoonCalendar.NEW_MOON: NEW_MOON_PATH,
+        _MoonCalendar.FIRST_QUARTER: FIRST_QUARTER_PATH,
+        _MoonCalendar.FULL_MOON: FULL_MOON_PATH,
+        _MoonCalendar.THIRD_QUARTER: THIRD_QUARTER_PATH,
+    }
+
     @staticmethod
     def image(phase) -> _libdraw.Image:
-        moon_path = None
-        if phase == _MoonCalendar.NEW_MOON:
-            moon_path = MoonPhaseImages.NEW_MOON_PATH
-        elif phase == _MoonCalendar.FIRST_QUARTER:
-            moon_path = MoonPhaseImages.FIRST_QUARTER_PATH
-        elif phase == _MoonCalendar.FULL_MOON:
-            moon_path = MoonPhaseImages.FULL_MOON_PATH
-        elif phase == _MoonCalendar.THIRD_QUARTER:
-            moon_path = MoonPhaseImages.THIRD_QUARTER_PATH
+        moon_path = MoonPhaseImages._PHASE_MAP.get(phase)
         if moon_path:
             return _libdraw.Image(moon_path)
         return moon_path
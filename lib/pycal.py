@@ -10,6 +10,7 @@ import sys
 import calendar
 import holidays
 import datetime
+import functools
 from xml.etree import ElementTree as ET
 from typing import List, Generator, Tuple
 import pathlib
@@ -276,6 +277,16 @@ class Month:
         """Return a tuple (weekdays, cells) where cells is a 2D list of Day."""
         return [self._days, self._cells]
 
+    @functools.cached_property
+    def short_weekday_headers(self) -> Tuple[str, ...]:
+        """Three-letter weekday names in table order (e.g. 'Sun')."""
+        return tuple(day[:3] for day in self._days)
+
+    @functools.cached_property
+    def display_title(self) -> str:
+        """Upper-cased "<NAME> <YEAR>" heading used by month pages."""
+        return f"{self._name} {self._year}".upper()
+
 
 class Calendar:
     """High-level calendar composed of months and front-page/artwork.